@@ -0,0 +1,159 @@
+import argparse
+import json
+import subprocess
+from pathlib import Path
+
+from manim import config, logger, tempconfig
+
+from render import QUALITIES
+from videos import concat_videos
+
+# the stream parameters that have to agree for the concat demuxer to copy packets
+STREAM_PARAMETERS = (
+    "codec_name",
+    "profile",
+    "width",
+    "height",
+    "pix_fmt",
+    "r_frame_rate",
+)
+
+
+class ManifestError(Exception):
+    pass
+
+
+# one line of a manifest: `<Scene>`, `<Scene> section <name>`, `<Scene> clip <n>`
+# or the path of any other video, with blank lines and # comments skipped
+def parse_manifest(path):
+    entries = []
+    for number, line in enumerate(Path(path).read_text(encoding="utf-8").splitlines()):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        scene, _, rest = line.partition(" ")
+        kind, _, name = rest.strip().partition(" ")
+        if kind in ("section", "clip") and name.strip():
+            entries.append((kind, scene, name.strip()))
+        elif Path(line).suffix:
+            entries.append(("file", line, None))
+        elif not rest:
+            entries.append(("scene", scene, None))
+        else:
+            raise ManifestError(f"{path}:{number + 1}: can't read {line!r}")
+    return entries
+
+
+def resolve(entry, module_name, base):
+    kind, scene, name = entry
+    extension = config["movie_file_extension"]
+    dirs = {"module_name": module_name, "scene_name": scene}
+    video_dir = config.get_dir("video_dir", **dirs)
+    if kind == "file":
+        return (base / scene).resolve()
+    if kind == "scene":
+        return video_dir / f"{scene}{extension}"
+    if kind == "clip":
+        # clips are numbered by narration mark; "lead" is whatever comes before
+        name = f"{int(name):02}" if name.isdigit() else name
+        return video_dir / f"{scene}_clips" / f"{scene}_{name}{extension}"
+
+    sections_dir = config.get_dir("sections_dir", **dirs)
+    index = sections_dir / f"{scene}.json"
+    if not index.exists():
+        raise ManifestError(
+            f"No section videos of {scene}; render it with --save-sections"
+        )
+    for section in json.loads(index.read_text(encoding="utf-8")):
+        if section["name"] == name:
+            return sections_dir / section["video"]
+    raise ManifestError(f"{scene} has no section {name!r}")
+
+
+def stream_parameters(path):
+    command = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        f"stream={','.join(STREAM_PARAMETERS)}",
+        "-of",
+        "json",
+        str(path),
+    ]
+    output = subprocess.run(command, check=True, capture_output=True, text=True)
+    streams = json.loads(output.stdout)["streams"]
+    return {key: streams[0].get(key) for key in STREAM_PARAMETERS} if streams else {}
+
+
+def check_parameters(videos):
+    reference = stream_parameters(videos[0])
+    for video in videos[1:]:
+        parameters = stream_parameters(video)
+        differences = [
+            f"{key} {parameters.get(key)} (vs. {reference[key]})"
+            for key in STREAM_PARAMETERS
+            if parameters.get(key) != reference[key]
+        ]
+        if differences:
+            raise ManifestError(
+                f"{video} can't be joined to {videos[0]} without re-encoding: "
+                + ", ".join(differences)
+            )
+
+
+# the presentation as listed in `manifest`, joined from the rendered videos by
+# packet copy after checking they were all encoded alike
+def assemble(manifest, scene_file, output=None):
+    manifest = Path(manifest)
+    module_name = Path(scene_file).stem
+    videos = [
+        resolve(entry, module_name, manifest.parent)
+        for entry in parse_manifest(manifest)
+    ]
+    missing = [str(video) for video in videos if not video.exists()]
+    if missing:
+        raise ManifestError("Not rendered yet: " + ", ".join(missing))
+    if not videos:
+        raise ManifestError(f"{manifest} lists no videos")
+    check_parameters(videos)
+    if output is None:
+        video_dir = config.get_dir("video_dir", module_name=module_name)
+        output = video_dir / f"{manifest.stem}{config['movie_file_extension']}"
+    concat_videos(videos, output)
+    logger.info(f"{len(videos)} videos joined into {output}")
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Join rendered scenes, sections and clips into one video."
+    )
+    parser.add_argument("file", help="scene file, e.g. project/scene.py")
+    parser.add_argument(
+        "manifest",
+        nargs="?",
+        default=Path(__file__).parent / "presentation.txt",
+        help="list of the videos to join, in order",
+    )
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("-o", "--output", type=Path)
+    args = parser.parse_args()
+
+    path = Path(args.file).resolve()
+    scene_config = {
+        "input_file": str(path),
+        "media_dir": str(path.parent / "media"),
+        "quality": QUALITIES[args.quality],
+    }
+    with tempconfig(scene_config):
+        try:
+            assemble(args.manifest, path, args.output)
+        except ManifestError as error:
+            parser.exit(1, f"{error}\n")
+
+
+if __name__ == "__main__":
+    main()
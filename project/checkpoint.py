@@ -0,0 +1,229 @@
+import hashlib
+import inspect
+import os
+import pickle
+import re
+from pathlib import Path
+
+import numpy as np
+from colour import Color
+from manim import *
+from manim import __version__ as manim_version
+
+# set to 0 to neither write nor resume from checkpoints, or to `read` to resume
+# without writing any (render.py's section workers, which share the directory)
+CHECKPOINTS_ENV = "CALC_CHECKPOINTS"
+
+# plain data attributes; updaters, functions and child lists are rebuilt by the code
+STATE_TYPES = (bool, int, float, str, Color, np.ndarray, type(None))
+
+
+# the scene no longer builds the mobjects a checkpoint was saved from
+class StaleCheckpointError(Exception):
+    pass
+
+
+def checkpoints_enabled():
+    return os.environ.get(CHECKPOINTS_ENV, "1") != "0"
+
+
+def checkpoints_writable():
+    return os.environ.get(CHECKPOINTS_ENV, "1") not in ("0", "read")
+
+
+def checkpoint_dir(scene):
+    module = Path(config["input_file"]).stem if config["input_file"] else ""
+    return config.get_dir("media_dir") / "checkpoints" / module / type(scene).__name__
+
+
+def checkpoint_path(scene, name):
+    slug = re.sub(r"[^\w-]+", "_", name)
+    return checkpoint_dir(scene) / f"{slug}.pkl"
+
+
+# holds the source hash of a checkpoint that turned out stale; until the code
+# changes, saving it again would only make the next render replay again
+def stale_marker(scene, name):
+    return checkpoint_path(scene, name).with_suffix(".stale")
+
+
+# everything that can influence the state at `line`: the scene file up to
+# that line, the helper modules next to it and the manim version
+def source_hash(path, line):
+    path = Path(path)
+    hasher = hashlib.sha256()
+    hasher.update("".join(path.read_text().splitlines(True)[:line]).encode())
+    for module in sorted(path.parent.glob("*.py")):
+        if module != path:
+            hasher.update(module.read_bytes())
+    hasher.update(manim_version.encode())
+    return hasher.hexdigest()
+
+
+# the construct() locals plus the camera's own trackers, by name
+def mobject_roots(scene, frame):
+    roots = {
+        name: value
+        for name, value in frame.f_locals.items()
+        if isinstance(value, Mobject)
+    }
+    for name, value in vars(scene.camera).items():
+        if isinstance(value, Mobject):
+            roots[f"camera.{name}"] = value
+    return dict(sorted(roots.items()))
+
+
+def mobject_keys(roots):
+    keys = {}
+    for name, root in roots.items():
+        for index, mob in enumerate(root.get_family()):
+            keys.setdefault(id(mob), (name, index))
+    return keys
+
+
+def mobject_state(mob):
+    return {
+        attr: value
+        for attr, value in vars(mob).items()
+        if isinstance(value, STATE_TYPES)
+    }
+
+
+def save_checkpoint(scene, frame, name, index):
+    roots = mobject_roots(scene, frame)
+    keys = mobject_keys(roots)
+    camera = scene.camera
+    fixed_orientation = getattr(camera, "fixed_orientation_mobjects", {})
+    fixed_in_frame = getattr(camera, "fixed_in_frame_mobjects", set())
+    try:
+        mobjects = [keys[id(mob)] for mob in scene.mobjects]
+        foreground = [keys[id(mob)] for mob in scene.foreground_mobjects]
+        orientation = [
+            (keys[id(mob)], keys.get(id(getattr(func, "__self__", None))))
+            for mob, func in fixed_orientation.items()
+        ]
+        in_frame = [keys[id(mob)] for mob in fixed_in_frame]
+    except KeyError:
+        # something on screen isn't reachable from a local, so it can't be restored
+        logger.debug(f"Not checkpointing section {name}: unnamed mobjects in scene")
+        return
+
+    source = source_hash(frame.f_code.co_filename, frame.f_lineno)
+    marker = stale_marker(scene, name)
+    if marker.exists() and marker.read_text() == source:
+        logger.debug(f"Not checkpointing section {name}: it didn't fit last time")
+        return
+
+    path = checkpoint_path(scene, name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    state = {
+        "name": name,
+        "index": index,
+        "line": frame.f_lineno,
+        "source": source,
+        "time": scene.renderer.time,
+        "num_plays": scene.renderer.num_plays,
+        "roots": {
+            root_name: [mobject_state(mob) for mob in root.get_family()]
+            for root_name, root in roots.items()
+        },
+        "mobjects": mobjects,
+        "foreground": foreground,
+        "fixed_orientation": orientation,
+        "fixed_in_frame": in_frame,
+    }
+    # renders resuming from it may be reading the old one meanwhile
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(pickle.dumps(state))
+    os.replace(tmp_path, path)
+    marker.unlink(missing_ok=True)
+
+
+def load_checkpoint(scene, name):
+    path = checkpoint_path(scene, name)
+    if not path.exists():
+        return None
+    try:
+        state = pickle.loads(path.read_bytes())
+    except (pickle.UnpicklingError, EOFError) as error:
+        raise StaleCheckpointError(name) from error
+    source_file = inspect.getsourcefile(type(scene))
+    if state["source"] != source_hash(source_file, state["line"]):
+        return None
+    return state
+
+
+# the earliest requested section, if every requested section has a valid checkpoint
+def find_resume_point(scene, sections):
+    try:
+        states = [load_checkpoint(scene, name) for name in sections]
+    except StaleCheckpointError as error:
+        logger.warning(f"The checkpoint of section {error} is unreadable")
+        return None
+    if not states or any(state is None for state in states):
+        return None
+    state = min(states, key=lambda state: state["index"])
+    return state if state["index"] > 0 else None
+
+
+# the saved attributes of every root whose family has the saved length
+def restore_roots(roots, saved_roots):
+    for name, root in roots.items():
+        family = root.get_family()
+        saved = saved_roots.get(name)
+        if saved is None or len(saved) != len(family):
+            continue
+        for mob, attrs in zip(family, saved):
+            for attr, value in attrs.items():
+                setattr(
+                    mob, attr, value.copy() if isinstance(value, np.ndarray) else value
+                )
+
+
+# the trackers are restored first and the updaters run, so redraw-style
+# mobjects rebuild at the checkpoint's values; after that every root has to
+# have the family it was saved with, or the saved keys point at the wrong
+# mobjects (an edited construct): then the checkpoint is discarded and
+# StaleCheckpointError raised, so the scene replays from the start
+def restore_checkpoint(scene, frame, state):
+    roots = mobject_roots(scene, frame)
+    restore_roots(roots, state["roots"])
+    for root in roots.values():
+        root.update(0)
+
+    families = {name: root.get_family() for name, root in roots.items()}
+    shapes = {name: len(family) for name, family in families.items()}
+    saved_shapes = {name: len(saved) for name, saved in state["roots"].items()}
+    if shapes != saved_shapes:
+        if checkpoints_writable():
+            checkpoint_path(scene, state["name"]).unlink(missing_ok=True)
+            stale_marker(scene, state["name"]).write_text(state["source"])
+        raise StaleCheckpointError(state["name"])
+    # the redrawn mobjects take their saved points and style as well
+    restore_roots(roots, state["roots"])
+
+    def lookup(key):
+        name, index = key
+        return families[name][index]
+
+    scene.mobjects = [lookup(key) for key in state["mobjects"]]
+    scene.foreground_mobjects = [lookup(key) for key in state["foreground"]]
+    camera = scene.camera
+    if hasattr(camera, "fixed_orientation_mobjects"):
+        camera.fixed_orientation_mobjects = {
+            lookup(key): (lookup(owner) if owner else lookup(key)).get_center
+            for key, owner in state["fixed_orientation"]
+        }
+    if hasattr(camera, "fixed_in_frame_mobjects"):
+        camera.fixed_in_frame_mobjects = {
+            lookup(key) for key in state["fixed_in_frame"]
+        }
+
+    renderer = scene.renderer
+    renderer.time = state["time"]
+    while renderer.num_plays < state["num_plays"]:
+        # keep partial movie indices lined up with the plays we never ran
+        renderer.file_writer.add_partial_movie_file(None)
+        renderer.animations_hashes.append(None)
+        renderer.num_plays += 1
+    logger.info(f"Resumed {type(scene).__name__} at section {state['name']}")
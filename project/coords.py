@@ -0,0 +1,16 @@
+import numpy as np
+
+
+# Axes.c2p for an (..., 3) array of coordinates at once; the axes are linear, so
+# their origin and unit vectors map every point. They are read on each call, so
+# axes that have been moved since are still right.
+def c2p(axes, coords):
+    coords = np.asarray(coords, dtype=float)
+    origin = axes.c2p(0, 0, 0)
+    basis = np.array([axes.c2p(*unit) - origin for unit in np.eye(3)])
+    return origin + coords @ basis
+
+
+def stack_coords(*coords):
+    arrays = np.broadcast_arrays(*(np.asarray(coord, dtype=float) for coord in coords))
+    return np.stack(arrays, axis=-1)
@@ -0,0 +1,118 @@
+import numpy as np
+from manim import *
+
+# how far (in pixels of the output) the curve may stray from a chord between
+# two samples before the interval is split
+PIXEL_TOLERANCE = 0.5
+# the first pass samples every `COARSE_FACTOR` t_steps, refinement does the rest
+COARSE_FACTOR = 8
+# most halvings of a first-pass interval
+MAX_DEPTH = 12
+
+
+# samples of `evaluate` (an array of t -> an (n, 3) array of points) on [t1, t2]:
+# a coarse grid, then every interval whose midpoint is more than `tolerance` off
+# its chord is split, all the midpoints of a pass evaluated in one call
+def adaptive_samples(evaluate, t1, t2, step, tolerance, max_depth=MAX_DEPTH):
+    count = max(int(np.ceil((t2 - t1) / step)), 1)
+    times = [np.linspace(t1, t2, count + 1)]
+    points = [evaluate(times[0])]
+    starts, ends = times[0][:-1], times[0][1:]
+    start_points, end_points = points[0][:-1], points[0][1:]
+
+    for _ in range(max_depth):
+        mids = (starts + ends) / 2
+        mid_points = evaluate(mids)
+        error = np.linalg.norm(mid_points - (start_points + end_points) / 2, axis=1)
+        split = error > tolerance
+        if not split.any():
+            break
+        times.append(mids[split])
+        points.append(mid_points[split])
+        starts, ends = (
+            np.concatenate([starts[split], mids[split]]),
+            np.concatenate([mids[split], ends[split]]),
+        )
+        start_points, end_points = (
+            np.concatenate([start_points[split], mid_points[split]]),
+            np.concatenate([mid_points[split], end_points[split]]),
+        )
+
+    times = np.concatenate(times)
+    order = np.argsort(times, kind="stable")
+    return times[order], np.concatenate(points)[order]
+
+
+# a ParametricFunction sampled densely only where it bends: flat stretches get
+# a few anchors and steep or curved ones as many as the pixel tolerance needs.
+# t_range's step sets the coarse grid (COARSE_FACTOR steps per sample)
+class AdaptiveParametricFunction(ParametricFunction):
+    def __init__(self, function, tolerance=None, **kwargs):
+        if tolerance is None:
+            tolerance = (
+                PIXEL_TOLERANCE * config["frame_height"] / config["pixel_height"]
+            )
+        self.tolerance = tolerance
+        super().__init__(function, **kwargs)
+
+    def evaluate(self, t):
+        t = self.scaling.function(t)
+        if self.use_vectorized:
+            x, y, z = self.function(t)
+            if not isinstance(z, np.ndarray):
+                z = np.zeros_like(x)
+            return np.stack(np.broadcast_arrays(x, y, z), axis=1)
+        return np.array([self.function(value) for value in t])
+
+    def generate_points(self):
+        boundary_times = [self.t_min, self.t_max]
+        if self.discontinuities is not None:
+            discontinuities = np.array(
+                [t for t in self.discontinuities if self.t_min <= t <= self.t_max]
+            )
+            boundary_times = np.sort(
+                [
+                    *boundary_times,
+                    *(discontinuities - self.dt),
+                    *(discontinuities + self.dt),
+                ]
+            )
+
+        for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
+            _, points = adaptive_samples(
+                self.evaluate, t1, t2, COARSE_FACTOR * self.t_step, self.tolerance
+            )
+            self.start_new_path(points[0])
+            self.add_points_as_corners(points[1:])
+        if self.use_smoothing:
+            self.make_smooth()
+        return self
+
+    init_points = generate_points
+
+
+# axes.plot with an AdaptiveParametricFunction
+def plot_adaptive(axes, function, x_range=None, **kwargs):
+    t_range = np.array(axes.x_range, dtype=float)
+    if x_range is not None:
+        t_range[: len(x_range)] = x_range
+    if x_range is None or len(x_range) < 3:
+        t_range[2] /= axes.num_sampled_graph_points_per_tick
+    graph = AdaptiveParametricFunction(
+        lambda t: axes.coords_to_point(t, function(t)),
+        t_range=t_range,
+        scaling=axes.x_axis.scaling,
+        **kwargs,
+    )
+    graph.underlying_function = function
+    return graph
+
+
+# axes.plot_parametric_curve with an AdaptiveParametricFunction
+def plot_parametric_adaptive(axes, function, **kwargs):
+    dim = axes.dimension
+    graph = AdaptiveParametricFunction(
+        lambda t: axes.coords_to_point(*function(t)[:dim]), **kwargs
+    )
+    graph.underlying_function = function
+    return graph
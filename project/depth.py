@@ -0,0 +1,78 @@
+import numpy as np
+from manim import *
+
+
+def packable(mob):
+    # plain bezier leaves, whose center is the middle of their anchors' box
+    return (
+        isinstance(mob, VMobject)
+        and not mob.submobjects
+        and not hasattr(mob, "z_index_group")
+        and len(mob.points) >= 4
+        and len(mob.points) % 4 == 0
+    )
+
+
+# Mobject.get_z_index_reference_point for every mobject, with the bezier leaves
+# (surface faces, lines) done as one reduction over all their anchors
+def reference_points(mobjects):
+    centers = np.empty((len(mobjects), 3))
+    packed = []
+    for index, mob in enumerate(mobjects):
+        if packable(mob):
+            packed.append(index)
+        else:
+            centers[index] = mob.get_z_index_reference_point()
+    if not packed:
+        return centers
+
+    points = [mobjects[index].points for index in packed]
+    # VMobject.get_anchors: the first and last point of every cubic
+    anchors = np.concatenate([np.stack([p[0::4], p[3::4]], 1) for p in points])
+    anchors = anchors.reshape(-1, 3)
+    starts = np.concatenate([[0], np.cumsum([len(p) // 2 for p in points])[:-1]])
+    lows = np.minimum.reduceat(anchors, starts)
+    highs = np.maximum.reduceat(anchors, starts)
+    centers[packed] = (lows + highs) / 2
+    return centers
+
+
+# ThreeDCamera's depth ordering with the sort keys computed in bulk and sorted by
+# argsort; if the mobjects are the same as last frame and last frame's order is
+# still sorted (the camera only moved a little), it's used as is
+class DepthSortedCamera(ThreeDCamera):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.previous_ids = None
+        self.previous_order = None
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
+        if not mobjects:
+            return mobjects
+        keys = np.full(len(mobjects), np.inf)
+        shaded = [
+            index
+            for index, mob in enumerate(mobjects)
+            if getattr(mob, "shade_in_3d", False)
+        ]
+        if shaded:
+            centers = reference_points([mobjects[index] for index in shaded])
+            keys[shaded] = centers @ self.get_rotation_matrix()[2]
+        order = self.depth_order(mobjects, keys)
+        return [mobjects[index] for index in order]
+
+    def depth_order(self, mobjects, keys):
+        ids = [id(mob) for mob in mobjects]
+        if ids == self.previous_ids:
+            order = self.previous_order
+            ordered = keys[order]
+            # sorted(key=...) is stable, so ties keep their original order
+            if np.all(
+                (ordered[1:] > ordered[:-1])
+                | ((ordered[1:] == ordered[:-1]) & (order[1:] > order[:-1]))
+            ):
+                return order
+        order = np.argsort(keys, kind="stable")
+        self.previous_ids, self.previous_order = ids, order
+        return order
@@ -1,7 +1,14 @@
 from manim import *
 
+from coords import c2p, stack_coords
+from depth import DepthSortedCamera
+from surfaces import PackedSurface, PackedTransform
+
 
 class Graph3D(ThreeDScene):
+    def __init__(self, **kwargs):
+        super().__init__(camera_class=DepthSortedCamera, **kwargs)
+
     def construct(self):
         self.next_section()
         axis_config = {
@@ -32,8 +39,10 @@ class Graph3D(ThreeDScene):
 
         self.remove(z_label)
 
-        surface1 = Surface(
-            lambda u, v: axes.c2p(u, v, 0.5 * np.sin(u) * 0.5 * np.cos(v)),
+        surface1 = PackedSurface(
+            lambda u, v: c2p(
+                axes, stack_coords(u, v, 0.5 * np.sin(u) * 0.5 * np.cos(v))
+            ),
             u_range=[-4, 4],
             v_range=[-4, 4],
             checkerboard_colors=[BLUE_C, RED_E],
@@ -42,8 +51,8 @@ class Graph3D(ThreeDScene):
             fill_opacity=0.5,
         )
 
-        surface2 = Surface(
-            lambda u, v: axes.c2p(u, v, np.sin(u) * np.cos(v)),
+        surface2 = PackedSurface(
+            lambda u, v: c2p(axes, stack_coords(u, v, np.sin(u) * np.cos(v))),
             u_range=[-4, 4],
             v_range=[-4, 4],
             checkerboard_colors=[RED_E, BLUE_C],
@@ -74,7 +83,7 @@ class Graph3D(ThreeDScene):
         self.next_section(skip_animations=True)
         self.play(Write(surface1, run_time=2))
         self.wait()
-        self.play(ReplacementTransform(surface1, surface2), run_time=2)
+        self.play(PackedTransform(surface1, surface2), run_time=2)
         self.wait()
         self.move_camera(
             phi=90 * DEGREES,
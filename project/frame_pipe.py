@@ -0,0 +1,93 @@
+import queue
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+from manim import logger
+
+# frames that may be waiting for the encoder; 1080p rgba is 8MB each
+FRAME_BUFFERS = 4
+
+# frames through the pipe, and seconds the renderer waited for a free buffer
+# (the encoder is behind) vs. the writer waited for a frame (the renderer is)
+pipe_stats = Counter()
+
+
+# the frames on their way to ffmpeg's stdin: the renderer copies each into one
+# of a fixed set of buffers and moves on, a thread writes them to the encoder
+# and hands the buffers back. When all of them are queued the renderer blocks
+class FramePipe:
+    def __init__(self, size=FRAME_BUFFERS):
+        self.size = size
+        self.buffers = []
+        self.free = queue.Queue()
+        self.pending = queue.Queue()
+        self.thread = None
+
+    def open(self, stream):
+        self.stream = stream
+        self.error = None
+        self.thread = threading.Thread(target=self.write_frames, daemon=True)
+        self.thread.start()
+
+    def buffer(self, frame):
+        if self.buffers and self.buffers[0].shape != frame.shape:
+            # wait for the writer to hand every buffer back, so the frames of
+            # the old shape are written before the pool is rebuilt at the new one
+            for _ in self.buffers:
+                self.free.get()
+            self.buffers.clear()
+        if len(self.buffers) < self.size and self.free.empty():
+            self.buffers.append(np.empty_like(frame))
+            return self.buffers[-1]
+        if self.free.empty():
+            pipe_stats["stalls"] += 1
+        start = time.perf_counter()
+        buffer = self.free.get()
+        pipe_stats["render_wait"] += time.perf_counter() - start
+        return buffer
+
+    def put(self, frame):
+        if self.error is not None:
+            raise self.error
+        buffer = self.buffer(frame)
+        np.copyto(buffer, frame)
+        self.pending.put(buffer)
+        pipe_stats["frames"] += 1
+
+    def write_frames(self):
+        while True:
+            start = time.perf_counter()
+            buffer = self.pending.get()
+            pipe_stats["encode_wait"] += time.perf_counter() - start
+            if buffer is None:
+                return
+            if self.error is None:
+                try:
+                    # the array itself, without a tobytes() copy
+                    self.stream.write(buffer)
+                except (BrokenPipeError, OSError, ValueError) as error:
+                    self.error = error
+            self.free.put(buffer)
+
+    # wait until every queued frame is written
+    def close(self):
+        if self.thread is None:
+            return
+        self.pending.put(None)
+        self.thread.join()
+        self.thread = None
+        if self.error is not None:
+            raise self.error
+
+
+def log_pipe_stats(scene_name):
+    if pipe_stats["frames"]:
+        logger.info(
+            f"{scene_name}: {pipe_stats['frames']} frames piped, the renderer waited "
+            f"{pipe_stats['render_wait']:.1f}s on the encoder "
+            f"({pipe_stats['stalls']} times) and the encoder "
+            f"{pipe_stats['encode_wait']:.1f}s on the renderer"
+        )
+    pipe_stats.clear()
@@ -0,0 +1,42 @@
+import os
+
+import numpy as np
+from manim import *
+
+# a multiplier on the quality-derived level of detail, e.g. 0.5 for rougher drafts
+LOD_ENV = "CALC_LOD"
+# comma separated name=factor pairs replacing the level of detail of the
+# mobjects built with that `lod` name, e.g. "surface=1,sphere=0.5"
+LOD_OVERRIDES_ENV = "CALC_LOD_OVERRIDES"
+# the pixel height the scenes' resolutions were chosen for
+REFERENCE_HEIGHT = 1080
+
+
+def lod_overrides():
+    value = os.environ.get(LOD_OVERRIDES_ENV, "")
+    pairs = [pair.split("=") for pair in value.split(",") if pair.strip()]
+    return {name.strip(): float(factor) for name, factor in pairs}
+
+
+# how much of the full resolution to sample: the output's pixel height against
+# 1080p times CALC_LOD, or the override for `name`
+def lod_factor(name=None):
+    overrides = lod_overrides()
+    if name in overrides:
+        return overrides[name]
+    scale = config["pixel_height"] / REFERENCE_HEIGHT
+    return scale * float(os.environ.get(LOD_ENV, "1"))
+
+
+# a tessellation resolution (int or per-axis tuple) scaled by the level of
+# detail, never below `minimum` and never above the given one
+def lod_resolution(resolution, name=None, minimum=2):
+    factor = min(lod_factor(name), 1.0)
+    scaled = np.maximum(np.rint(np.asarray(resolution) * factor), minimum)
+    scaled = np.minimum(scaled, resolution).astype(int)
+    return int(scaled) if scaled.ndim == 0 else tuple(scaled.tolist())
+
+
+# a sampling step (t_range, x_range) scaled the other way
+def lod_step(step, name=None):
+    return step / min(lod_factor(name), 1.0)
@@ -0,0 +1,120 @@
+import argparse
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+from manim import config, logger
+
+from tex_cache import parse_size
+
+DEFAULT_MAX_SIZE = "4G"
+
+
+# animation hashes don't cover the output settings, so the key adds them
+def store_key(hash_animation, width, height, fps):
+    settings = (
+        f"{hash_animation}|{width}x{height}|{fps:g}|"
+        f"{config['movie_file_extension']}|{config['transparent']}"
+    )
+    return hashlib.sha256(settings.encode()).hexdigest()[:32]
+
+
+# a hard link, else (across file systems) a symlink if allowed, else a copy;
+# only per-scene files may be symlinks, and only to entries of the store
+def link(source, target, symlink=True):
+    target.unlink(missing_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        if symlink:
+            try:
+                target.symlink_to(Path(source).resolve())
+                return
+            except OSError:
+                pass
+        shutil.copy2(source, target)
+
+
+# partial movie files shared by every scene file and quality directory; the
+# per-scene partial_movie_files directories only hold links into it
+class PartialStore:
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, key):
+        return self.root / key[:2] / f"{key}{config['movie_file_extension']}"
+
+    def fetch(self, key, target):
+        path = self.path(key)
+        if not path.exists():
+            return False
+        os.utime(path)
+        link(path, target)
+        logger.debug(f"Linked {target.name} from the partial store")
+        return True
+
+    def add(self, key, source):
+        path = self.path(key)
+        # an entry symlinked to a per-scene file (older stores) is replaced
+        if path.exists() and not path.is_symlink() and path.samefile(source):
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        # the entry has to outlive the scene's file, so never a symlink to it
+        link(source, tmp, symlink=False)
+        os.replace(tmp, path)
+
+    def entries(self):
+        return [
+            path
+            for path in self.root.glob(f"*/*{config['movie_file_extension']}")
+            if path.is_file()
+        ]
+
+    # least recently used first, until the store fits in max_size
+    def prune(self, max_size):
+        max_size = parse_size(max_size)
+        entries = sorted(self.entries(), key=lambda path: path.stat().st_mtime)
+        total = sum(path.stat().st_size for path in entries)
+        evicted = 0
+        for path in entries:
+            if total <= max_size:
+                break
+            total -= path.stat().st_size
+            path.unlink()
+            evicted += 1
+        return evicted, total
+
+
+def get_store():
+    return PartialStore(config.get_dir("media_dir") / "partial_store")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the partial movie store.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    prune = subparsers.add_parser("prune", help="evict least recently used partials")
+    prune.add_argument(
+        "--store-dir",
+        default=Path(__file__).parent / "media" / "partial_store",
+        type=Path,
+    )
+    prune.add_argument(
+        "--max-size",
+        default=os.environ.get("CALC_PARTIAL_STORE_SIZE", DEFAULT_MAX_SIZE),
+        help="size budget, e.g. 4G",
+    )
+    args = parser.parse_args()
+
+    if args.command == "prune":
+        store = PartialStore(args.store_dir)
+        evicted, total = store.prune(args.max_size)
+        print(
+            f"{len(store.entries())} partials, {total / 1024**2:.1f} MiB "
+            f"({evicted} evicted)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import numpy as np
+from manim import *
+
+from lod import lod_resolution
+
+# corner index pairs of the square's edges, quad_one through quad_four
+SQUARE_EDGES = ((0, 1), (2, 1), (2, 3), (0, 3))
+
+
+# the line from `start` to `end` as a matrix and offset for a unit mesh along z
+def segment_transform(start, end):
+    vect = end - start
+    length = np.linalg.norm(vect)
+    if length < 1e-8:
+        return np.zeros((3, 3)), (start + end) / 2
+    return z_to_vector(vect) * np.array([1.0, 1.0, length]), (start + end) / 2
+
+
+# a Line3D drawn as one stroked segment instead of a cylinder of faces, and
+# shade_in_3d puts it in the camera's depth ordering. Strokes are in frame units,
+# which the 3D camera's zoom doesn't scale, so with the camera's `zoom` the
+# stroke is as wide as the cylinder would project (perspective aside)
+class ThinLine3D(Line):
+    def __init__(
+        self, start=LEFT, end=RIGHT, thickness=0.02, zoom=1, color=None, **kwargs
+    ):
+        self.thickness = thickness
+        kwargs.setdefault("stroke_width", 2 * thickness * zoom * 100)
+        super().__init__(start, end, shade_in_3d=True, **kwargs)
+        if color is not None:
+            self.set_color(color)
+
+
+# the square cross section as four lines (Line3D or ThinLine3D) built once; each
+# frame their points are rewritten in place from `corners`, a function returning
+# the square's four corners (+x, +y, -x, -y) in scene coordinates. Cylinders
+# are tessellated at Line3D's resolution scaled by the level of detail, strokes
+# are scaled by the camera's `zoom`
+class CrossSection(VGroup):
+    def __init__(
+        self,
+        corners,
+        line_class=Line3D,
+        thickness=0.02,
+        color=PURPLE_A,
+        lod="line",
+        zoom=1,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.corners = corners
+        line_kwargs = {}
+        if issubclass(line_class, Cylinder):
+            line_kwargs["resolution"] = lod_resolution((24, 24), lod)
+        elif issubclass(line_class, ThinLine3D):
+            line_kwargs["zoom"] = zoom
+        template = line_class(
+            start=0.5 * IN, end=0.5 * OUT, thickness=thickness, **line_kwargs
+        )
+        template.set_color(color)
+        self.add(*(template.copy() for _ in SQUARE_EDGES))
+
+        family = template.get_family()
+        meshes = [index for index, mob in enumerate(family) if len(mob.points)]
+        self.unit_mesh = np.concatenate([family[index].points for index in meshes])
+        self.part_ends = np.cumsum([len(family[index].points) for index in meshes])
+        self.mesh_buffer = np.empty_like(self.unit_mesh)
+        self.edge_parts = [
+            [edge.get_family()[index] for index in meshes] for edge in self.submobjects
+        ]
+
+        self.update_mesh()
+        self.add_updater(lambda mob: mob.update_mesh())
+
+    def update_mesh(self):
+        corners = self.corners()
+        for parts, (start, end) in zip(self.edge_parts, SQUARE_EDGES):
+            matrix, center = segment_transform(corners[start], corners[end])
+            np.matmul(self.unit_mesh, matrix.T, out=self.mesh_buffer)
+            self.mesh_buffer += center
+            begin = 0
+            for mob, part_end in zip(parts, self.part_ends):
+                part = self.mesh_buffer[begin:part_end]
+                if mob.points.shape == part.shape:
+                    mob.points[:] = part
+                else:
+                    # an animation (e.g. Create) left a partial copy of the mesh
+                    mob.points = part.copy()
+                begin = part_end
+        return self
+
+
+_sphere_templates = {}
+
+
+# a Dot3D that follows `point`, a function returning its center; the sphere is
+# tessellated once per radius and resolution (scaled by the level of detail)
+# and each frame only shifted
+def marker_sphere(
+    point, radius=DEFAULT_DOT_RADIUS, color=WHITE, resolution=(8, 8), lod="sphere"
+):
+    resolution = lod_resolution(resolution, lod, minimum=4)
+    key = (radius, tuple(resolution))
+    if key not in _sphere_templates:
+        _sphere_templates[key] = Dot3D(radius=radius, resolution=resolution)
+    marker = _sphere_templates[key].copy().set_color(color)
+    marker.add_updater(lambda mob: mob.move_to(point()), call_updater=True)
+    return marker
@@ -0,0 +1,81 @@
+from manim import *
+
+# every character a readout can show, compiled once per process
+GLYPHS = "0123456789.-=rz"
+RELATIONS = "="
+
+# spacing as a fraction of the digit height (roughly TeX's math spacing)
+GLYPH_GAP = 0.1
+RELATION_GAP = 0.45
+
+_glyph_cache = {}
+
+
+# glyph -> template mobject with its left edge at x = 0 and its baseline at y = 0
+def get_glyphs():
+    if not _glyph_cache:
+        # one substring per glyph, so each part is its own submobject
+        sheet = MathTex(*GLYPHS)
+        baseline = sheet[GLYPHS.index("1")].get_bottom()[1]
+        for char, part in zip(GLYPHS, sheet):
+            part.shift([-part.get_left()[0], -baseline, 0.0])
+            _glyph_cache[char] = part
+
+        # digits get a fixed-width cell so values don't jitter as they change
+        digit_width = max(_glyph_cache[d].width for d in "0123456789")
+        _glyph_cache["cell"] = digit_width
+        _glyph_cache["height"] = _glyph_cache["0"].height
+    return _glyph_cache
+
+
+# "label=value" readout assembled from cached glyphs, never invokes LaTeX once warm
+class NumericReadout(VGroup):
+    def __init__(
+        self,
+        label,
+        value,
+        num_decimal_places=4,
+        font_size=DEFAULT_FONT_SIZE,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.label = label
+        self.num_decimal_places = num_decimal_places
+        self.font_size = font_size
+        self.set_value(value)
+
+    def get_tex_string(self):
+        return f"{self.label}={round(self.value, self.num_decimal_places)}"
+
+    def set_value(self, value):
+        anchor = self.get_left() if self.submobjects else None
+        self.value = value
+
+        glyphs = get_glyphs()
+        gap = GLYPH_GAP * glyphs["height"]
+        rel_gap = RELATION_GAP * glyphs["height"]
+
+        parts = []
+        x = 0.0
+        for char in self.get_tex_string():
+            if char not in glyphs:
+                raise ValueError(f"NumericReadout has no glyph for {char!r}")
+            glyph = glyphs[char].copy()
+            if char in RELATIONS:
+                x += rel_gap - gap
+            if char.isdigit():
+                glyph.shift([x + (glyphs["cell"] - glyph.width) / 2.0, 0.0, 0.0])
+                x += glyphs["cell"] + gap
+            else:
+                glyph.shift([x, 0.0, 0.0])
+                x += glyph.width + gap
+            if char in RELATIONS:
+                x += rel_gap - gap
+            parts.append(glyph)
+
+        self.submobjects = parts
+        self.set_color(self.color)
+        self.scale(self.font_size / DEFAULT_FONT_SIZE, about_point=ORIGIN)
+        if anchor is not None:
+            self.move_to(anchor, LEFT)
+        return self
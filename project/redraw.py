@@ -0,0 +1,90 @@
+from collections import Counter
+
+import numpy as np
+from manim import *
+
+# the attributes VMobject.interpolate_color carries over in Mobject.become
+STYLE_ATTRS = (
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_direction",
+    "sheen_factor",
+)
+# arrays each mobject owns; anything else (e.g. sheen_direction) may be a shared
+# constant and is only ever replaced
+OWNED_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+# frames where the redrawn mobject was copied into the existing one vs. rebuilt
+redraw_counts = Counter()
+
+
+def same_structure(family, new_family):
+    return len(family) == len(new_family) and all(
+        type(mob) is type(new) for mob, new in zip(family, new_family)
+    )
+
+
+# copy into the existing array when the shapes allow it
+def assign(mob, attr, value):
+    current = getattr(mob, attr, None)
+    if attr not in OWNED_ARRAYS or not isinstance(value, np.ndarray):
+        setattr(mob, attr, value)
+    elif isinstance(current, np.ndarray) and current.shape == value.shape:
+        current[...] = value
+    else:
+        setattr(mob, attr, value.copy())
+
+
+def copy_into(family, new_family):
+    for mob, new in zip(family, new_family):
+        assign(mob, "points", new.points)
+        if isinstance(mob, VMobject):
+            for attr in STYLE_ATTRS:
+                assign(mob, attr, getattr(new, attr))
+        elif type(mob).interpolate_color is not Mobject.interpolate_color:
+            mob.interpolate_color(mob, new, 1)
+        else:
+            # a plain Mobject (a Group) only has its color; its interpolate_color
+            # raises NotImplementedError
+            mob.color = new.color
+
+
+# the redraw's parts taken over outright: Mobject.become keeps a larger old
+# family (padded with faded copies), so a checkpoint's shape would depend on
+# the redraw's history, and calls that same interpolate_color on every member
+def rebuild(mob, new):
+    mob.submobjects = new.submobjects
+    copy_into([mob], [new])
+
+
+# always_redraw that keeps the first mobject's arrays and submobject lists and
+# copies each frame's redraw into them while the structure stays the same
+def pooled_redraw(func):
+    mob = func()
+
+    def update(mob):
+        new = func()
+        family = mob.get_family()
+        new_family = new.get_family()
+        if same_structure(family, new_family):
+            copy_into(family, new_family)
+            redraw_counts["reused"] += 1
+        else:
+            rebuild(mob, new)
+            redraw_counts["rebuilt"] += 1
+
+    mob.add_updater(update)
+    return mob
+
+
+def log_redraw_counts(scene_name):
+    total = sum(redraw_counts.values())
+    if total:
+        logger.info(
+            f"{scene_name}: {redraw_counts['reused']} of {total} redraws reused "
+            f"their mobject ({redraw_counts['rebuilt']} rebuilt)"
+        )
+    redraw_counts.clear()
@@ -0,0 +1,290 @@
+import argparse
+import importlib
+import multiprocessing
+import os
+import sys
+from itertools import groupby
+from pathlib import Path
+
+from manim import DefaultSectionType, logger, tempconfig
+from manim.utils.file_ops import open_file
+
+import tex_cache
+import tex_pool
+from checkpoint import CHECKPOINTS_ENV, checkpoints_enabled
+from sections import SECTIONS_ENV
+from streams import STREAM_SECTIONS_ENV, load_frame_plan, save_frame_plan
+from writer import (
+    EXTRA_OUTPUTS_ENV,
+    PARTIALS_ONLY_ENV,
+    ProjectFileWriter,
+    parse_quality,
+)
+
+# the scene being rendered in parallel; modules don't pickle, forked workers inherit it
+_parallel_scene = None
+# (module, scene name, config) of every scene of a batch, inherited the same way
+_batch_scenes = None
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def load_module(path):
+    path = Path(path).resolve()
+    sys.path.insert(0, str(path.parent))
+    return importlib.import_module(path.stem)
+
+
+# `Scene` from the scene file, or `path/to/module.py:Scene` from another module
+def scene_spec(spec, default_file):
+    path, _, name = spec.rpartition(":")
+    return Path(path or default_file).resolve(), name
+
+
+def render_config(args, path=None):
+    path = Path(path or args.file).resolve()
+    return {
+        "input_file": str(path),
+        "media_dir": str(path.parent / "media"),
+        "quality": QUALITIES[args.quality],
+        "preview": args.preview,
+        "save_sections": args.save_sections,
+    }
+
+
+def render_scene(module, name, scene_config):
+    with tempconfig(scene_config):
+        scene = getattr(module, name)()
+        scene.render()
+    return scene
+
+
+# one pass with every play skipped, only to list the sections, checkpoint them
+# and plan how many frames each play writes
+def checkpoint_pass(module, name, scene_config):
+    pass_config = {
+        **scene_config,
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "preview": False,
+        "from_animation_number": sys.maxsize,
+    }
+    selection = os.environ.pop(SECTIONS_ENV, None)
+    try:
+        scene = render_scene(module, name, pass_config)
+    finally:
+        if selection is not None:
+            os.environ[SECTIONS_ENV] = selection
+    frame_plan = getattr(scene.renderer, "frame_plan", None)
+    if frame_plan is not None:
+        # the plan goes with the scene's media directory and frame rate
+        with tempconfig(pass_config):
+            save_frame_plan(name, frame_plan)
+    return scene
+
+
+def render_section(section):
+    module, name, scene_config = _parallel_scene
+    os.environ[SECTIONS_ENV] = section
+    os.environ[PARTIALS_ONLY_ENV] = "1"
+    # the checkpoint pass wrote them all; other workers may be reading them
+    if checkpoints_enabled():
+        os.environ[CHECKPOINTS_ENV] = "read"
+    try:
+        scene = render_scene(module, name, {**scene_config, "preview": False})
+    finally:
+        tex_cache.get_cache().save()
+        tex_pool.close_pools()
+    return scene.renderer.file_writer.partial_movie_files
+
+
+# the scene's movie, section videos and narration clips, combined from the
+# partials of every section worker as a render in one process would have
+def finish_parallel(pass_scene, name, scene_config, partial_movie_files):
+    renderer = pass_scene.renderer
+    sections = [section for section, _ in renderer.frame_plan]
+    with tempconfig(scene_config):
+        file_writer = ProjectFileWriter(renderer, name)
+        file_writer.narration_marks = renderer.file_writer.narration_marks
+        file_writer.play_lengths = renderer.file_writer.play_lengths
+        file_writer.partial_movie_files = partial_movie_files
+        plays = range(len(partial_movie_files))
+        for section, indices in groupby(plays, key=lambda play: sections[play]):
+            files = [partial_movie_files[play] for play in indices]
+            skipped = all(path is None for path in files)
+            file_writer.next_section(section, DefaultSectionType.NORMAL, skipped)
+            file_writer.sections[-1].partial_movie_files = files
+        file_writer.finish()
+    return file_writer.movie_file_path
+
+
+# every section renders in its own process, resuming from its checkpoint, and
+# only writes its partial movie files; this process then combines them
+def render_parallel(module, name, scene_config, processes, sections=None):
+    global _parallel_scene
+    pass_scene = checkpoint_pass(module, name, scene_config)
+    seen = getattr(pass_scene, "seen_sections", [])
+    if not seen or not hasattr(pass_scene.renderer, "frame_plan"):
+        logger.info(f"{name} has no sections, rendering it in one process")
+        scene = render_scene(module, name, scene_config)
+        return getattr(scene.renderer.file_writer, "movie_file_path", None)
+    jobs = [section for section in seen if sections is None or section in sections]
+    if not jobs:
+        logger.warning(f"{name} has none of the sections {', '.join(sections)}")
+        return None
+    tex_cache.get_cache().save()
+    # the Tex workers' pipes aren't to be shared between processes
+    tex_pool.close_pools()
+
+    logger.info(f"Rendering {len(jobs)} sections of {name} in {processes} processes")
+    _parallel_scene = (module, name, scene_config)
+    context = multiprocessing.get_context("fork")
+    partial_movie_files = [None] * len(pass_scene.renderer.frame_plan)
+    with context.Pool(processes, maxtasksperchild=1) as pool:
+        for files in pool.imap_unordered(render_section, jobs, chunksize=1):
+            for play, path in enumerate(files):
+                if path is not None:
+                    partial_movie_files[play] = path
+    if all(path is None for path in partial_movie_files):
+        return None
+
+    movie = finish_parallel(pass_scene, name, scene_config, partial_movie_files)
+    logger.info(f"{name} written to {movie}")
+    if scene_config["preview"]:
+        open_file(movie)
+    return movie
+
+
+def render_batch_scene(index):
+    module, name, scene_config = _batch_scenes[index]
+    try:
+        scene = render_scene(module, name, {**scene_config, "preview": False})
+    finally:
+        tex_cache.get_cache().save()
+        tex_pool.close_pools()
+    file_writer = scene.renderer.file_writer
+    if not hasattr(file_writer, "movie_file_path"):
+        return index, None
+    return index, str(file_writer.movie_file_path)
+
+
+# every scene is first run with its plays skipped in this process, which
+# compiles its Tex, parses its SVGs and glyphs and loads its fonts (and writes
+# checkpoints and frame plans); the workers are forked from the warm process
+# and take the scenes longest first
+def render_batch(scenes, processes):
+    global _batch_scenes
+    frames = []
+    for module, name, scene_config in scenes:
+        checkpoint_pass(module, name, scene_config)
+        with tempconfig(scene_config):
+            frame_plan = load_frame_plan(name, required=False) or []
+        frames.append(sum(count for _, count in frame_plan))
+    tex_cache.get_cache().save()
+    # the Tex workers' pipes aren't to be shared between processes
+    tex_pool.close_pools()
+
+    order = sorted(range(len(scenes)), key=lambda index: -frames[index])
+    logger.info(f"Rendering {len(scenes)} scenes in {processes} processes")
+    _batch_scenes = scenes
+    context = multiprocessing.get_context("fork")
+    movies = [None] * len(scenes)
+    with context.Pool(processes, maxtasksperchild=1) as pool:
+        for index, movie in pool.imap_unordered(render_batch_scene, order, chunksize=1):
+            movies[index] = movie
+            logger.info(f"{scenes[index][1]} written to {movie}")
+    for (_, _, scene_config), movie in zip(scenes, movies):
+        if scene_config["preview"] and movie is not None:
+            open_file(movie)
+    return movies
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render scenes, optionally only some of their sections."
+    )
+    parser.add_argument("file", help="scene file, e.g. project/scene.py")
+    parser.add_argument(
+        "scenes",
+        nargs="+",
+        help="scene classes to render, or path/to/module.py:Scene from another file",
+    )
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument(
+        "-s",
+        "--sections",
+        nargs="+",
+        metavar="NAME",
+        help="sections to render; every other section is fast-forwarded",
+    )
+    parser.add_argument("--save-sections", action="store_true")
+    parser.add_argument(
+        "-j",
+        "--parallel-sections",
+        type=int,
+        metavar="N",
+        help="render the sections in N processes and join them",
+    )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        type=int,
+        metavar="N",
+        help="render the scenes in N processes forked after warming the caches",
+    )
+    parser.add_argument(
+        "--also",
+        nargs="+",
+        metavar="QUALITY",
+        help="extra qualities such as 480p15 encoded from the same render",
+    )
+    parser.add_argument(
+        "--stream-sections",
+        action="store_true",
+        help="encode each section with one ffmpeg and cut the partials out of it",
+    )
+    parser.add_argument("-p", "--preview", action="store_true")
+    args = parser.parse_args()
+    if args.batch and args.parallel_sections:
+        parser.error("--batch and --parallel-sections can't be combined")
+
+    if args.also:
+        for spec in args.also:
+            parse_quality(spec)
+        os.environ[EXTRA_OUTPUTS_ENV] = ",".join(args.also)
+    if args.stream_sections:
+        os.environ[STREAM_SECTIONS_ENV] = "1"
+    if args.sections and not args.parallel_sections:
+        os.environ[SECTIONS_ENV] = ",".join(args.sections)
+
+    scenes = []
+    for spec in args.scenes:
+        path, name = scene_spec(spec, args.file)
+        scenes.append((load_module(path), name, render_config(args, path)))
+    if args.batch:
+        render_batch(scenes, args.batch)
+        return
+
+    for module, name, scene_config in scenes:
+        if args.parallel_sections:
+            render_parallel(
+                module,
+                name,
+                scene_config,
+                args.parallel_sections,
+                args.sections,
+            )
+        else:
+            if args.stream_sections:
+                checkpoint_pass(module, name, scene_config)
+            render_scene(module, name, scene_config)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,33 @@
 from manim import *
-import math
 
-CROSS_SEC_INT = 1.18 * math.sqrt(2) / 2.0
-Z_INT = 1.02
+import tent
+import tex_cache
+import tex_pool
+from coords import c2p, stack_coords
+from curves import plot_adaptive, plot_parametric_adaptive
+from depth import DepthSortedCamera
+from lod import lod_step
+from primitives import CrossSection, ThinLine3D, marker_sphere
+from readout import NumericReadout
+from redraw import pooled_redraw
+from sections import SectionScene
+from tent import CROSS_SEC_INT, CURVATURE, Z_INT
+from tex_batch import BatchTex
+from trajectory import TrajectoryTracker
+
+tex_cache.install()
+tex_pool.install()
+
+
+class MainView(SectionScene, BatchTex, ThreeDScene):
+    def __init__(self, **kwargs):
+        super().__init__(camera_class=DepthSortedCamera, **kwargs)
 
-
-# z = f(x) = f(y) ITO z is f(z) = 2sqrt(51-50z)/sqrt(293)
-def fz(z):
-    return 2.0 * math.sqrt(51.0 - 50.0 * z) / math.sqrt(293)
-
-
-class MainView(ThreeDScene):
     def construct(self):
-        """
+        self.mark_narration("""
         First, let's orient ourselves in 3D.
-        """
-        self.next_section("Graph Setup", skip_animations=True)
+        """)
+        self.next_section("Graph Setup")
 
         # graph setup
         axis_config = {
@@ -53,26 +65,30 @@ class MainView(ThreeDScene):
         self.remove(z_label)
 
         # setup for z = f(x) = f(y)
-        x_graph = axes.plot_parametric_curve(
+        x_graph = plot_parametric_adaptive(
+            axes,
             lambda t: np.array(
                 [
                     t,
-                    0,
-                    -1.465 * t**2 + 1.02,
+                    np.zeros_like(t),
+                    tent.profile(t),
                 ]
             ),
-            t_range=np.array([-CROSS_SEC_INT, CROSS_SEC_INT]),
+            t_range=np.array([-CROSS_SEC_INT, CROSS_SEC_INT, lod_step(0.01, "curve")]),
+            use_vectorized=True,
             color=GREEN_B,
         )
-        y_graph = axes.plot_parametric_curve(
+        y_graph = plot_parametric_adaptive(
+            axes,
             lambda t: np.array(
                 [
-                    0,
+                    np.zeros_like(t),
                     t,
-                    -1.465 * t**2 + 1.02,
+                    tent.profile(t),
                 ]
             ),
-            t_range=np.array([-CROSS_SEC_INT, CROSS_SEC_INT]),
+            t_range=np.array([-CROSS_SEC_INT, CROSS_SEC_INT, lod_step(0.01, "curve")]),
+            use_vectorized=True,
             color=GREEN_B,
         )
 
@@ -97,105 +113,81 @@ class MainView(ThreeDScene):
         )
         self.wait(2.5)
 
-        self.next_section("Function Visualization", skip_animations=True)
+        self.next_section("Function Visualization")
 
-        """
+        self.mark_narration("""
             Note that the base of the tent is a square. This square can be defined by two identical 
             parametric curves, with one in the XZ plane and the other in the YZ plane. These curves
             are the metal frame of the tent.
-        """
+        """)
 
         self.wait(2.5)
         self.play(Create(x_graph), Create(y_graph), run_time=2.0)
         self.begin_ambient_camera_rotation(0.1)
 
-        z = ValueTracker(0)
+        z = TrajectoryTracker(0)
+        # everything the updaters need from z, tabulated once per sweep
+        radius = z.derive(tent.r)
+        corners = z.derive(lambda zs: c2p(axes, tent.corners(zs)))
+        radius_end = z.derive(lambda zs: c2p(axes, stack_coords(tent.r(zs), 0, 0)))
 
         # square cross section
-        quad_one = always_redraw(
-            lambda: Line3D(
-                start=axes.c2p(fz(z.get_value()), 0, z.get_value()),
-                end=axes.c2p(0, fz(z.get_value()), z.get_value()),
-                color=PURPLE_A,
-            )
-        )
-        quad_two = always_redraw(
-            lambda: Line3D(
-                start=axes.c2p(-fz(z.get_value()), 0, z.get_value()),
-                end=axes.c2p(0, fz(z.get_value()), z.get_value()),
-                color=PURPLE_A,
-            )
-        )
-        quad_three = always_redraw(
-            lambda: Line3D(
-                start=axes.c2p(-fz(z.get_value()), 0, z.get_value()),
-                end=axes.c2p(0, -fz(z.get_value()), z.get_value()),
-                color=PURPLE_A,
-            )
+        sqr_sec = CrossSection(
+            corners.get_value,
+            ThinLine3D,
+            color=PURPLE_A,
+            zoom=self.camera.get_zoom(),
         )
-        quad_four = always_redraw(
-            lambda: Line3D(
-                start=axes.c2p(fz(z.get_value()), 0, z.get_value()),
-                end=axes.c2p(0, -fz(z.get_value()), z.get_value()),
-                color=PURPLE_A,
-            )
-        )
-        sqr_sec = VGroup(quad_one, quad_two, quad_three, quad_four)
 
         self.play(Write(sqr_sec, lag_ratio=0.0), run_time=2.0)
         self.wait(20.0)
 
-        self.next_section("Cross Section Visualization", skip_animations=False)
+        self.next_section("Cross Section Visualization")
 
-        """
+        self.mark_narration("""
             If we were able to get the relationship between z and the area of each square cross section, 
             then we would be able to get the volume of the tent. In other words, we want to integrate some 
             function A(z) from z=0 to z=tent_height such that A(z) gets us the area of the square cross section 
             at some value z.
-        """
+        """)
 
         self.wait(2.5)
 
-        self.play(z.animate.set_value(Z_INT), run_time=15.0)
+        self.play(z.sweep(Z_INT), run_time=15.0)
         self.play(FadeOut(sqr_sec))
 
         self.wait(2.5)
 
         # ~~~~ RENDER AS ONE SECTION AND SPLICE AT EACH MULTILINE COMMENT ~~~~~
-        self.next_section("XY", skip_animations=True)
+        self.next_section("XY")
 
-        """
+        self.mark_narration("""
             Well, how can we do that? Let's first look at each square cross section from the top down,
             such that we will be looking at the XY plane.
-        """
+        """)
 
         # showing radius in top view
-        dot = always_redraw(
-            lambda: Dot3D(
-                point=axes.c2p(fz(z.get_value()), 0, z.get_value()),
-                color=RED,
-                radius=0.1,
-            )
-        )
-        r_line = always_redraw(
+        dot = marker_sphere(lambda: corners.get_value()[0], radius=0.1, color=RED)
+        r_line = pooled_redraw(
             lambda: axes.get_horizontal_line(
-                axes.c2p(fz(z.get_value()), 0, 0),
+                radius_end.get_value(),
                 color=ORANGE,
                 stroke_width=5.0,
                 line_func=Line,
             ),
         )
-        r_obj = always_redraw(
+        r_obj = pooled_redraw(
             lambda: MathTex("r", color=ORANGE).next_to(r_line, DOWN, buff=0.8)
         )
-        r_val_obj = always_redraw(
-            lambda: MathTex(f"r={round(fz(z.get_value()), 4)}", color=ORANGE).to_edge(
+        r_val_obj = pooled_redraw(
+            lambda: NumericReadout("r", radius.get_value(), color=ORANGE).to_edge(
                 UR, buff=0.5
             )
         )
-        z_val_obj = always_redraw(
-            lambda: MathTex(
-                f"z={round(z.get_value(), 4)}",
+        z_val_obj = pooled_redraw(
+            lambda: NumericReadout(
+                "z",
+                z.get_value(),
                 color=BLUE,
             ).next_to(r_val_obj, DOWN, buff=0.5)
         )
@@ -211,28 +203,29 @@ class MainView(ThreeDScene):
             theta=-90 * DEGREES,
             gamma=0 * DEGREES,
             added_anims=[
-                FadeOut(z_axis, z_label),
+                FadeOut(z_axis),
+                FadeOut(z_label),
                 Rotate(y_label, -90 * DEGREES, [0.0, 0.0, 1.0]),
             ],
             zoom=0.6,
         )
         self.wait(2.5)
-        self.play(z.animate.set_value(0), run_time=0.1)
+        self.play(z.sweep(0), run_time=0.1)
 
-        """
+        self.mark_narration("""
             Let's draw in a line r from the center of the square to one of its corners such that r is the 
             square's radius. 
-        """
+        """)
 
         self.wait()
         self.play(Create(r_line))
         self.play(Create(r_obj))
         self.wait()
 
-        """
+        self.mark_narration("""
             Now, before we play the animation again, let's keep track of the value of r and 
             z as z increases.
-        """
+        """)
 
         self.wait()
         self.play(Create(sqr_sec), run_time=5.0)
@@ -242,35 +235,39 @@ class MainView(ThreeDScene):
         self.play(Create(z_val_obj))
         self.wait(5)
 
-        """
+        self.mark_narration("""
             Notice the clear relationship between r and z: they are inversely proportional. 
             Why is this useful? Well that's because we can directly relate the square's radius 
             to its area!  
             {Transition to TopView after this section}
-        """
+        """)
 
-        self.play(z.animate.set_value(Z_INT), run_time=15.0)
+        self.play(z.sweep(Z_INT), run_time=15.0)
 
-        self.next_section("XZ", skip_animations=True)
+        self.next_section("XZ")
 
-        """
+        self.mark_narration("""
             {show slides}
             Again, we want the relationship, or in other words, a function, relating z and the area, 
             since we are basically integrating A(z) = 2 * r(z)^2. How can we find this function? Right now, 
             we only know the relationship between radius and area. Well first, let's orient ourselves on 
             the XZ plane, such that we are looking at parametric function on the XZ plane. 
             {go to SideView}
-        """
+        """)
 
-        # go to XZ plane
+        # go to XZ plane; one fade per mobject, as a fade of several leaves their
+        # unnamed Group in the scene, which a checkpoint can't refer to
         self.move_camera(
             phi=90 * DEGREES,
             theta=-90 * DEGREES,
             gamma=0 * DEGREES,
             added_anims=[
-                FadeOut(y_axis, y_label),
-                FadeOut(top_render, sqr_sec),
-                FadeIn(z_axis, z_label),
+                FadeOut(y_axis),
+                FadeOut(y_label),
+                FadeOut(top_render),
+                FadeOut(sqr_sec),
+                FadeIn(z_axis),
+                FadeIn(z_label),
                 Rotate(x_axis, 90 * DEGREES, [1.0, 0.0, 0.0]),
                 # Rotate(z_axis, 90 * DEGREES, [0.0, 0.0, 1.0]),
             ],
@@ -278,47 +275,52 @@ class MainView(ThreeDScene):
         )
         self.wait(5)
 
-        self.next_section("Complete 3D Visualization", skip_animations=True)
+        self.next_section("Complete 3D Visualization")
 
-        """
+        self.mark_narration("""
             If we go back into 3D, we can see all these components in play. Notice that as the value of
             z increases, r and area decreases and thus area decreases as well, which our new equation now models.
             Now that we finally have our equation relating z to cross section area, we can now integrate it.
             {go to AreaGraph}
-        """
+        """)
 
-        self.play(z.animate.set_value(0), run_time=0.1)
+        self.play(z.sweep(0), run_time=0.1)
         self.wait(0.1)
 
-        trace_lines = always_redraw(
-            lambda: axes.get_lines_to_point(
-                axes.c2p(fz(z.get_value()), 0, z.get_value())
-            ),
+        trace_lines = pooled_redraw(
+            lambda: axes.get_lines_to_point(corners.get_value()[0]),
         )
 
         self.move_camera(
             phi=75 * DEGREES,
             theta=-25 * DEGREES,
             added_anims=[
-                FadeIn(y_axis, y_label),
+                FadeIn(y_axis),
+                FadeIn(y_label),
                 Rotate(x_axis, -90 * DEGREES, [1.0, 0.0, 0.0]),
             ],
             zoom=0.6,
         )
         self.wait()
-        self.play(FadeIn(dot, r_line, r_obj, trace_lines, sqr_sec))
-        self.play(z.animate.set_value(Z_INT), run_time=15)
+        self.play(
+            FadeIn(dot),
+            FadeIn(r_line),
+            FadeIn(r_obj),
+            FadeIn(trace_lines),
+            FadeIn(sqr_sec),
+        )
+        self.play(z.sweep(Z_INT), run_time=15)
         self.wait()
 
 
-class TopView(Scene):
+class TopView(SectionScene, BatchTex, Scene):
     def construct(self):
         # ~~~~ RENDER TOGETHER, SPLICE AT MULTILINES ~~~~
 
-        """
+        self.mark_narration("""
         To do this, let's say you start with a square like before.
         Again, let's draw in a radius line.
-        """
+        """)
 
         # scene setup
         sqr = Square(side_length=4.0).shift(UP * 0.5)
@@ -337,24 +339,24 @@ class TopView(Scene):
         self.play(Create(r_line), FadeIn(r_obj))
         self.wait()
 
-        """
+        self.mark_narration("""
             If we draw in another 2 radii, we form 2 large right triangles.
-        """
+        """)
 
         self.play(Create(d_line), FadeIn(d_obj))
         self.wait()
 
-        """
+        self.mark_narration("""
             From this information, we can get the equation for a square based
             on its radius by adding the area formed by the 2 triangles.
             {go to MainView XZ}
-        """
+        """)
 
         self.play(DrawBorderThenFill(sqr_eqn))
         self.wait()
 
 
-class SideView(Scene):
+class SideView(SectionScene, BatchTex, Scene):
     def construct(self):
         # ~~~~ RENDER TOGETHER, SPLICE AT MULTILINES ~~~~
 
@@ -370,9 +372,11 @@ class SideView(Scene):
         axes_labels = VGroup(x_label, z_label)
 
         # function setup
-        cross_sec_graph = axes.plot(
-            lambda x: -1.465 * x**2 + 1.02,
-            x_range=[-CROSS_SEC_INT, CROSS_SEC_INT],
+        cross_sec_graph = plot_adaptive(
+            axes,
+            tent.profile,
+            x_range=[-CROSS_SEC_INT, CROSS_SEC_INT, lod_step(0.02, "curve")],
+            use_vectorized=True,
             color=GREEN_B,
         )
         x_r_int = VGroup(
@@ -388,55 +392,56 @@ class SideView(Scene):
             .next_to(axes.c2p(-CROSS_SEC_INT, 0, 0), UP, buff=0.2),
         )
         y_int = VGroup(
-            Dot(point=axes.c2p(0, 1.02, 0), color=BLUE),
-            MathTex("(0, 1.02)")
+            Dot(point=axes.c2p(0, Z_INT, 0), color=BLUE),
+            MathTex(f"(0, {Z_INT:g})")
             .scale(0.75)
-            .next_to(axes.c2p(0, 1.02, 0), RIGHT, buff=0.2),
+            .next_to(axes.c2p(0, Z_INT, 0), RIGHT, buff=0.2),
         )
         points = VGroup(x_r_int, x_l_int, y_int)
-        func = MathTex("f(x) = -1.465x^{2} + 1.02").next_to(axes, UP, buff=0.4)
+        func = MathTex(f"f(x) = -{CURVATURE:g}x^{{2}} + {Z_INT:g}").next_to(
+            axes, UP, buff=0.4
+        )
 
         # dot and liens tracing the function
-        x = ValueTracker(CROSS_SEC_INT)
-        dot = always_redraw(
+        x = TrajectoryTracker(CROSS_SEC_INT)
+        # everything the updaters need from x, tabulated once per sweep
+        height = x.derive(tent.profile)
+        point = x.derive(lambda xs: c2p(axes, stack_coords(xs, tent.profile(xs), 0)))
+        foot = x.derive(lambda xs: c2p(axes, stack_coords(xs, 0, 0)))
+        dot = pooled_redraw(
             lambda: Dot(
-                point=axes.c2p(
-                    x.get_value(), cross_sec_graph.underlying_function(x.get_value()), 0
-                ),
+                point=point.get_value(),
                 color=RED,
             )
         )
-        lines = always_redraw(
-            lambda: axes.get_lines_to_point(
-                axes.c2p(
-                    x.get_value(), cross_sec_graph.underlying_function(x.get_value()), 0
-                )
-            ),
+        lines = pooled_redraw(
+            lambda: axes.get_lines_to_point(point.get_value()),
         )
-        r_line = always_redraw(
+        r_line = pooled_redraw(
             lambda: axes.get_horizontal_line(
-                axes.c2p(x.get_value(), 0, 0),
+                foot.get_value(),
                 color=ORANGE,
                 stroke_width=10.0,
                 line_func=Line,
             ),
         )
-        r_tex = always_redraw(
+        r_tex = pooled_redraw(
             lambda: MathTex("r", color=ORANGE).next_to(r_line, DOWN, buff=0.8)
         )
-        r = always_redraw(
-            lambda: MathTex(f"r={round(x.get_value(), 4)}", color=ORANGE).to_edge(
+        r = pooled_redraw(
+            lambda: NumericReadout("r", x.get_value(), color=ORANGE).to_edge(
                 UR, buff=2.0
             )
         )
-        z = always_redraw(
-            lambda: MathTex(
-                f"z={round(cross_sec_graph.underlying_function(x.get_value()), 4)}",
+        z = pooled_redraw(
+            lambda: NumericReadout(
+                "z",
+                height.get_value(),
                 color=BLUE,
             ).next_to(r, DOWN, buff=0.5)
         )
 
-        """
+        self.mark_narration("""
             Here we're just going to redraw the graph real quick.
             
             {go to slides after show intercepts}
@@ -454,7 +459,7 @@ class SideView(Scene):
 
             Since the graph of f(x) and f(y) are basically the same and z = f(x) = f(y),
             we'll only look at f(x).
-        """
+        """)
 
         self.play(DrawBorderThenFill(axes), run_time=2)
         self.play(DrawBorderThenFill(axes_labels))
@@ -466,21 +471,21 @@ class SideView(Scene):
         self.play(Create(dot), Create(lines), Create(r_line), Create(r_tex))
         self.wait()
 
-        """
+        self.mark_narration("""
             If we play the animation again, you can see that r = x, hence z is dependent on r.
             {video ends, show slides}
             Thus if we solve z = f(x) in terms of z, we'll get a function where r is dependent on z.
             With this new function r = x = f(z), we are able to create our area function A(z) = 2 * r(z)^2.
             {go to MainView Complete 3D Visual} 
-        """
+        """)
 
         self.wait()
         self.play(Create(r), Create(z))
         self.wait()
-        self.play(x.animate.set_value(0), run_time=15)
+        self.play(x.sweep(0), run_time=15)
 
 
-class AreaGraph(MovingCameraScene):
+class AreaGraph(SectionScene, BatchTex, MovingCameraScene):
     def construct(self):
         # ~~~~ RENDER TOGETHER, SPLICE AT MULTILINES ~~~~
 
@@ -502,13 +507,15 @@ class AreaGraph(MovingCameraScene):
         fz_label.move_to([-5.0, 5.5, 0.0])
 
         # function setup
-        fz_graph = axes.plot(
-            lambda x: 2.0 * math.sqrt(51.0 - 50.0 * x) / math.sqrt(293),
+        fz_graph = plot_adaptive(
+            axes,
+            tent.r,
             x_range=[0, Z_INT],
+            use_vectorized=True,
             color=RED_A,
         )
-        az_graph = axes.plot(
-            lambda x: 2.0 * fz(float(x)) ** 2.0, x_range=[0, Z_INT], color=BLUE_A
+        az_graph = plot_adaptive(
+            axes, tent.area, x_range=[0, Z_INT], use_vectorized=True, color=BLUE_A
         )
 
         fz_graph_label = (
@@ -529,7 +536,7 @@ class AreaGraph(MovingCameraScene):
 
         x_int = VGroup(
             Dot(point=axes.c2p(Z_INT, 0, 0), color=BLUE),
-            MathTex("(1.02, 0)").next_to(axes.c2p(Z_INT, 0, 0), UP, buff=0.2),
+            MathTex(f"({Z_INT:g}, 0)").next_to(axes.c2p(Z_INT, 0, 0), UP, buff=0.2),
         )
 
         area = axes.get_area(graph=az_graph, x_range=[0, Z_INT], color=[BLUE, YELLOW])
@@ -537,9 +544,9 @@ class AreaGraph(MovingCameraScene):
         self.camera.frame_center = axes.get_center()
         self.camera.frame.scale(2.0)
 
-        """
+        self.mark_narration("""
             So let's first look at the graph of r(z). It sort of looks like a rotated parabola as you'd expect.
-        """
+        """)
 
         self.play(DrawBorderThenFill(axes))
         self.play(DrawBorderThenFill(axes_labels))
@@ -547,12 +554,12 @@ class AreaGraph(MovingCameraScene):
         self.play(Create(fz_graph_label), run_time=0.5)
         self.wait(2)
 
-        """
+        self.mark_narration("""
             Here is the graph of A(z). Again, A(z) shows us the area of the tent's cross section at a given z value and 
             is equal to 2 * r(z)^2.
             Visually, it makes sense too, since the area is greater at a lower z, like near the base, and the area is
             smaller at a higher z, like near the top of the tent.
-        """
+        """)
 
         self.wait()
         self.play(Create(az_graph), run_time=2)
@@ -560,9 +567,9 @@ class AreaGraph(MovingCameraScene):
         self.play(Write(x_int))
         self.wait()
 
-        """
+        self.mark_narration("""
             Now if we take the integral of A(z), i.e. sum up the infinite amount of cross section areas, we get our volume.
-        """
+        """)
 
         self.play(FadeIn(area), run_time=5)
         self.play(TransformMatchingTex(az_graph_label, az_integral_label))
@@ -0,0 +1,161 @@
+import inspect
+import os
+
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.exceptions import EndSceneEarlyException
+
+from checkpoint import (
+    StaleCheckpointError,
+    checkpoints_enabled,
+    checkpoints_writable,
+    find_resume_point,
+    restore_checkpoint,
+    save_checkpoint,
+)
+from frame_pipe import log_pipe_stats
+from redraw import log_redraw_counts
+from streams import planned_frames
+from writer import ProjectFileWriter
+
+# comma separated section names to render, every other section is fast-forwarded
+SECTIONS_ENV = "CALC_SECTIONS"
+
+
+def selected_sections():
+    value = os.environ.get(SECTIONS_ENV, "")
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    return names or None
+
+
+# the stock renderer still rasterizes the static and frozen frames of skipped
+# plays; here a skipped play only advances time and mobject state
+class FastForwardRenderer(CairoRenderer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # [section, frames] for every play, saved by render.py's first pass
+        self.frame_plan = []
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        section = self.file_writer.sections[-1].name
+        frames = planned_frames(scene)
+        self.frame_plan.append([section, frames])
+        self.file_writer.play_lengths[self.num_plays - 1] = frames
+
+    def update_frame(
+        self,
+        scene,
+        mobjects=None,
+        include_submobjects=True,
+        ignore_skipping=False,
+        **kwargs,
+    ):
+        super().update_frame(
+            scene, mobjects, include_submobjects, ignore_skipping, **kwargs
+        )
+
+    # the writer copies the frame into its own buffer, so get_frame's copy is skipped
+    def render(self, scene, time, moving_mobjects):
+        self.update_frame(scene, moving_mobjects)
+        self.add_frame(self.camera.pixel_array)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        if self.skip_animations:
+            self.static_image = None
+            return None
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    # a static wait is drawn once and handed to the encoder once
+    def freeze_current_frame(self, duration):
+        if self.skip_animations:
+            return
+        dt = 1 / self.camera.frame_rate
+        num_frames = int(duration / dt)
+        self.time += num_frames * dt
+        self.file_writer.write_still(self.get_frame(), num_frames)
+
+    def scene_finished(self, scene):
+        # a requested last frame is drawn even if the last section was skipped
+        self.skip_animations = False
+        super().scene_finished(scene)
+
+
+# sections selected via CALC_SECTIONS render, the rest fast-forward; when every
+# selected section has a checkpoint from an unchanged scene, the code before
+# the first one runs without playing anything and the checkpoint is restored
+class SectionScene:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.seen_sections = []
+        if type(self.renderer) is CairoRenderer:
+            self.renderer = FastForwardRenderer(
+                file_writer_class=ProjectFileWriter,
+                camera_class=self.camera_class,
+                skip_animations=self.renderer._original_skipping_status,
+            )
+            self.renderer.init_scene(self)
+
+        self.resume_state = None
+        sections = selected_sections()
+        if sections is not None and checkpoints_enabled():
+            self.resume_state = find_resume_point(self, sections)
+
+    # construct() has already run up to a stale checkpoint with its plays
+    # skipped, so the replay starts over in a fresh instance; with the
+    # checkpoint deleted, that one doesn't look for a resume point
+    def render(self, preview=False):
+        try:
+            return super().render(preview)
+        except StaleCheckpointError as error:
+            logger.info(
+                f"The checkpoint of {type(self).__name__}'s section {error} is "
+                "stale, replaying from the start"
+            )
+        self.__dict__ = type(self)().__dict__
+        return self.render(preview)
+
+    def play(self, *args, **kwargs):
+        if self.resume_state is not None:
+            return
+        super().play(*args, **kwargs)
+
+    # a narration line starts before the next play; the movie is cut there
+    def mark_narration(self, text):
+        self.renderer.file_writer.mark_narration(self.renderer.num_plays, text)
+
+    def next_section(
+        self,
+        name="unnamed",
+        type=DefaultSectionType.NORMAL,
+        skip_animations=False,
+    ):
+        frame = inspect.currentframe().f_back
+        self.seen_sections.append(name)
+        sections = selected_sections()
+        if sections is not None:
+            skip_animations = name not in sections
+            # nothing after the last selected section can show up in the video
+            if skip_animations and set(sections) <= set(self.seen_sections):
+                raise EndSceneEarlyException()
+
+        if self.resume_state is not None:
+            if name == self.resume_state["name"]:
+                restore_checkpoint(self, frame, self.resume_state)
+                self.resume_state = None
+        elif checkpoints_writable():
+            save_checkpoint(self, frame, name, len(self.seen_sections) - 1)
+        super().next_section(name, type, skip_animations)
+
+    def tear_down(self):
+        super().tear_down()
+        log_redraw_counts(type(self).__name__)
+        log_pipe_stats(type(self).__name__)
+        sections = selected_sections()
+        if sections is not None:
+            missing = [name for name in sections if name not in self.seen_sections]
+            if missing:
+                logger.warning(
+                    f"{type(self).__name__} has no section(s) {', '.join(missing)}; "
+                    f"available: {', '.join(self.seen_sections)}"
+                )
@@ -0,0 +1,154 @@
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import numpy as np
+from manim import config, logger
+
+# set to 1 to encode each section's plays with one ffmpeg, using the frame plan
+# of the scene's last render.py pass, and cut the partials out of it afterwards
+STREAM_SECTIONS_ENV = "CALC_STREAM_SECTIONS"
+
+
+def streaming_enabled():
+    return os.environ.get(STREAM_SECTIONS_ENV, "0") != "0"
+
+
+# the frames a finished play wrote: a static wait is held for int(duration / dt)
+# frames (freeze_current_frame), anything else gets one per play_internal step
+def planned_frames(scene):
+    dt = 1 / config["frame_rate"]
+    if scene.is_current_animation_frozen_frame():
+        return int(scene.duration / dt)
+    return len(np.arange(0, scene.duration, dt))
+
+
+def plan_path(scene_name):
+    module = Path(config["input_file"]).stem if config["input_file"] else ""
+    return config.get_dir("media_dir") / "frame_plans" / module / f"{scene_name}.json"
+
+
+# `plays` is a [section name, frames] pair for every play of the scene, in order
+def save_frame_plan(scene_name, plays):
+    path = plan_path(scene_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    plan = {"frame_rate": config["frame_rate"], "plays": plays}
+    path.write_text(json.dumps(plan), encoding="utf-8")
+
+
+# the plan when streaming is on; required=False reads it regardless, quietly
+def load_frame_plan(scene_name, required=True):
+    if required and not streaming_enabled():
+        return None
+    path = plan_path(scene_name)
+    if not path.exists():
+        if required:
+            logger.warning(f"No frame plan for {scene_name}, encoding every play alone")
+        return None
+    plan = json.loads(path.read_text(encoding="utf-8"))
+    if plan["frame_rate"] != config["frame_rate"]:
+        logger.warning(f"The frame plan for {scene_name} is for another frame rate")
+        return None
+    return plan["plays"]
+
+
+# the time of the boundary before frame `n`, half a frame early so that
+# rounding can't push it past the frame
+def boundary_times(boundaries):
+    fps = config["frame_rate"]
+    return [(frame - 0.5) / fps for frame in sorted(set(boundaries)) if frame > 0]
+
+
+def format_times(times):
+    return ",".join(f"{time:.6f}" for time in times)
+
+
+# one section's plays encoded back to back, with a keyframe planned at the start
+# of every play so each one can be cut out again without re-encoding
+class SectionStream:
+    def __init__(self, path, first_play, plan):
+        self.path = Path(path)
+        self.first_play = first_play
+        self.plan = plan
+        self.plays = []
+        self.process = None
+
+        section = plan[first_play][0]
+        ends = []
+        for name, frames in plan[first_play:]:
+            if name != section:
+                break
+            ends.append((ends[-1] if ends else 0) + frames)
+        self.keyframes = boundary_times(ends[:-1])
+
+    @property
+    def next_play(self):
+        return self.first_play + len(self.plays)
+
+    def planned(self, play):
+        return self.plan[play][1] if play < len(self.plan) else None
+
+    def add_play(self, partial_movie_file, frames):
+        self.plays.append((Path(partial_movie_file), frames))
+
+
+# split `source` at `times` into `targets`, copying the packets; the cuts land on
+# the first keyframe at or after each time, which the stream was forced to have
+def segment(source, times, targets):
+    source = Path(source)
+    pattern = source.with_name(f"{source.stem}_%04d{source.suffix}")
+    command = [
+        config.ffmpeg_executable,
+        "-y",
+        "-i",
+        str(source),
+        "-loglevel",
+        config["ffmpeg_loglevel"].lower(),
+        "-nostdin",
+        "-map",
+        "0",
+        "-c",
+        "copy",
+        "-f",
+        "segment",
+        "-reset_timestamps",
+        "1",
+    ]
+    if times:
+        command += ["-segment_times", format_times(times)]
+    subprocess.run([*command, str(pattern)], check=True)
+    pieces = sorted(
+        source.parent.glob(f"{source.stem}_[0-9][0-9][0-9][0-9]{source.suffix}")
+    )
+    if len(pieces) != len(targets):
+        for piece in pieces:
+            piece.unlink()
+        return False
+    for piece, target in zip(pieces, targets):
+        piece.replace(target)
+    return True
+
+
+# the fallback when the stream didn't split where planned: re-encode each piece
+def trim(source, times, targets, codec, filters):
+    bounds = [0.0, *times, None]
+    for start, end, target in zip(bounds, bounds[1:], targets):
+        cut = f"trim=start={start:.6f}" + ("" if end is None else f":end={end:.6f}")
+        subprocess.run(
+            [
+                config.ffmpeg_executable,
+                "-y",
+                "-i",
+                str(source),
+                "-loglevel",
+                config["ffmpeg_loglevel"].lower(),
+                "-nostdin",
+                "-vf",
+                ",".join([cut, "setpts=PTS-STARTPTS", *filters]),
+                "-an",
+                *codec,
+                str(target),
+            ],
+            check=True,
+        )
@@ -0,0 +1,124 @@
+import numpy as np
+from manim import *
+from manim.mobject.three_d.three_dimensions import ThreeDVMobject
+
+from lod import lod_resolution
+
+# the per-face arrays kept in one packed array each
+PACKED_ATTRS = ("points", "fill_rgbas", "stroke_rgbas")
+
+
+# (u, v) grid indices of a face's 16 bezier points: four straight-in-uv edges
+# u1v1 -> u2v1 -> u2v2 -> u1v2 -> u1v1, sampled at thirds for the handles
+def face_indices(u_res, v_res):
+    i, j = np.meshgrid(np.arange(u_res), np.arange(v_res), indexing="ij")
+    i, j = 3 * i.reshape(-1, 1), 3 * j.reshape(-1, 1)
+    k = np.arange(4)
+    u_index = np.hstack([i + k, i + 3 + 0 * k, i + 3 - k, i + 0 * k])
+    v_index = np.hstack([j + 0 * k, j + k, j + 3 + 0 * k, j + 3 - k])
+    return u_index, v_index
+
+
+# a Surface whose function is evaluated once over the whole (u, v) grid; `func`
+# takes arrays of u and v and returns an array of points of shape (..., 3).
+# The faces' points and colors are views into packed arrays, so morphing into
+# another PackedSurface of the same resolution is one array blend. The
+# resolution is scaled by the level of detail under the name `lod`
+class PackedSurface(VGroup):
+    def __init__(
+        self,
+        func,
+        u_range=[0, 1],
+        v_range=[0, 1],
+        resolution=32,
+        fill_color=BLUE_D,
+        fill_opacity=1.0,
+        checkerboard_colors=[BLUE_D, BLUE_E],
+        stroke_color=LIGHT_GREY,
+        stroke_width=0.5,
+        stroke_opacity=1.0,
+        lod="surface",
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.func = func
+        self.u_range = u_range
+        self.v_range = v_range
+        self.resolution = resolution = lod_resolution(resolution, lod)
+        u_res, v_res = np.broadcast_to(resolution, 2)
+
+        u, v = np.meshgrid(
+            np.linspace(*u_range, 3 * u_res + 1),
+            np.linspace(*v_range, 3 * v_res + 1),
+            indexing="ij",
+        )
+        grid = np.asarray(func(u, v), dtype=float)
+        u_index, v_index = face_indices(u_res, v_res)
+        points = grid[u_index, v_index]
+
+        faces = []
+        for index, face_points in enumerate(points):
+            face = ThreeDVMobject()
+            face.points = face_points
+            face.u_index, face.v_index = divmod(index, v_res)
+            faces.append(face)
+        self.add(*faces)
+        self.set_fill(color=fill_color, opacity=fill_opacity)
+        self.set_stroke(color=stroke_color, width=stroke_width, opacity=stroke_opacity)
+        if checkerboard_colors:
+            self.set_fill_by_checkerboard(*checkerboard_colors)
+        self.repack()
+
+    def set_fill_by_checkerboard(self, *colors, opacity=None):
+        for face in self:
+            face.set_fill(colors[(face.u_index + face.v_index) % len(colors)], opacity)
+        return self
+
+    # gather the faces' arrays into packed ones and point the faces back at them;
+    # anything that replaced a face's array since (set_fill, animations) is picked up
+    def repack(self):
+        self.packed = {}
+        for attr in PACKED_ATTRS:
+            arrays = [getattr(face, attr) for face in self.submobjects]
+            if len({array.shape for array in arrays}) != 1:
+                continue
+            packed = np.array(arrays, dtype=float)
+            for face, view in zip(self.submobjects, packed):
+                setattr(face, attr, view)
+            self.packed[attr] = packed
+        return self
+
+
+# ReplacementTransform between two PackedSurfaces of the same resolution,
+# blending the packed arrays instead of every face's
+class PackedTransform(Animation):
+    def __init__(self, surface, target, **kwargs):
+        self.target = target
+        super().__init__(surface, **kwargs)
+
+    def create_starting_mobject(self):
+        # the blend only needs the start arrays, not a copy of every face
+        return self.mobject
+
+    def begin(self):
+        self.mobject.repack()
+        self.target.repack()
+        self.attrs = [
+            attr
+            for attr, packed in self.mobject.packed.items()
+            if attr in self.target.packed
+            and packed.shape == self.target.packed[attr].shape
+        ]
+        self.start = {attr: self.mobject.packed[attr].copy() for attr in self.attrs}
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        for attr in self.attrs:
+            start, end = self.start[attr], self.target.packed[attr]
+            np.add(start, alpha * (end - start), out=self.mobject.packed[attr])
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        scene.remove(self.mobject)
+        scene.add(self.target)
@@ -0,0 +1,41 @@
+import numpy as np
+
+# the tent's outline in the xz (and yz) plane is the parabola z = Z_INT - CURVATURE x^2;
+# every function here takes a number or a whole array of them
+Z_INT = 1.02
+CURVATURE = 1.465
+CROSS_SEC_INT = 1.18 * np.sqrt(2) / 2.0
+
+
+def profile(x):
+    return -CURVATURE * np.asarray(x) ** 2 + Z_INT
+
+
+# z = f(x) = f(y) ITO z is r(z) = 2sqrt(51-50z)/sqrt(293), the profile's inverse
+def r(z):
+    # z = Z_INT can round just past the apex
+    return 2.0 * np.sqrt(np.maximum(51.0 - 50.0 * np.asarray(z), 0.0)) / np.sqrt(293)
+
+
+# the cross section at height z is a square with half-diagonal r(z)
+def area(z):
+    return 2.0 * r(z) ** 2.0
+
+
+# (x, y, z) of the cross section's corners on the +x, +y, -x and -y axes
+def corners(z):
+    z = np.asarray(z, dtype=float)
+    radius = r(z)
+    zero = np.zeros_like(radius)
+    return np.stack(
+        [
+            np.stack(corner, axis=-1)
+            for corner in (
+                (radius, zero, z),
+                (zero, radius, z),
+                (-radius, zero, z),
+                (zero, -radius, z),
+            )
+        ],
+        axis=-2,
+    )
@@ -0,0 +1,47 @@
+import multiprocessing
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import *
+
+import render
+from sections import SectionScene
+
+
+class ThreeSections(SectionScene, Scene):
+    def construct(self):
+        square = Square()
+        self.next_section("one")
+        self.play(square.animate.shift(RIGHT))
+        self.next_section("two")
+        self.play(square.animate.shift(UP))
+        self.next_section("three")
+        self.play(square.animate.scale(2))
+
+
+# two section workers resuming at once from the checkpoints of one pass
+def test_section_workers_only_read_checkpoints(tmp_path):
+    module = sys.modules[__name__]
+    scene_config = {
+        "input_file": __file__,
+        "media_dir": str(tmp_path),
+        "write_to_movie": False,
+        "preview": False,
+        "save_sections": False,
+    }
+    render.checkpoint_pass(module, "ThreeSections", scene_config)
+    directory = tmp_path / "checkpoints" / Path(__file__).stem / "ThreeSections"
+    checkpoints = {path: path.stat().st_mtime_ns for path in directory.glob("*.pkl")}
+    assert {path.stem for path in checkpoints} == {"one", "two", "three"}
+
+    render._parallel_scene = (module, "ThreeSections", scene_config)
+    context = multiprocessing.get_context("fork")
+    with context.Pool(2, maxtasksperchild=1) as pool:
+        pool.map(render.render_section, ["two", "three"], chunksize=1)
+
+    assert {path: path.stat().st_mtime_ns for path in checkpoints} == checkpoints
+    assert sorted(directory.iterdir()) == sorted(checkpoints)
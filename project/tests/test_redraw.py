@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import *
+
+from redraw import pooled_redraw, redraw_counts
+
+
+# a Group (a plain Mobject) of point clouds, none of them VMobjects
+def points_group(tracker, count=2):
+    return Group(
+        *(Point(location=[tracker.get_value() + index, 0, 0]) for index in range(count))
+    )
+
+
+def test_pooled_redraw_reuses_a_group_of_non_vmobjects():
+    tracker = ValueTracker(0)
+    group = pooled_redraw(lambda: points_group(tracker))
+    family = group.get_family()
+    redraw_counts.clear()
+
+    tracker.set_value(1)
+    group.update(0)
+
+    assert redraw_counts["reused"] == 1
+    assert group.get_family() == family
+    np.testing.assert_allclose(group[1].points, [[2, 0, 0]])
+
+
+def test_pooled_redraw_rebuilds_a_group_of_non_vmobjects():
+    tracker = ValueTracker(0)
+    count = ValueTracker(3)
+    group = pooled_redraw(lambda: points_group(tracker, int(count.get_value())))
+    redraw_counts.clear()
+
+    count.set_value(1)
+    group.update(0)
+
+    assert redraw_counts["rebuilt"] == 1
+    assert len(group) == 1
+    np.testing.assert_allclose(group[0].points, [[0, 0, 0]])
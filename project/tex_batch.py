@@ -0,0 +1,181 @@
+import inspect
+import json
+import os
+import re
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+
+from manim import *
+from manim.mobject.svg import svg_mobject
+from manim.mobject.text import numbers, tex_mobject
+from manim.utils import tex_file_writing
+from manim.utils.tex_file_writing import tex_hash
+
+import readout
+import tex_cache
+
+# stands in for every Tex svg while we only want to know which strings exist
+PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1" viewBox="0 0 1 1">'
+    '<path d="M0 0H1V1H0Z"/></svg>'
+)
+
+BEGIN_DOCUMENT = "\\begin{document}"
+END_DOCUMENT = "\\end{document}"
+
+
+def texcode(expression, environment, tex_template):
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+@contextmanager
+def recording_tex():
+    jobs = {}
+    placeholder = config.get_dir("tex_dir") / "placeholder.svg"
+    placeholder.parent.mkdir(parents=True, exist_ok=True)
+    placeholder.write_text(PLACEHOLDER_SVG)
+
+    def record(expression, environment=None, tex_template=None):
+        if tex_template is None:
+            tex_template = config["tex_template"]
+        output = texcode(expression, environment, tex_template)
+        jobs[tex_hash(output)] = (output, tex_template)
+        return placeholder
+
+    # placeholder mobjects must not leak into the caches the real run reads
+    caches = [
+        numbers.string_to_mob_map,
+        svg_mobject.SVG_HASH_TO_MOB_MAP,
+        readout._glyph_cache,
+    ]
+    saved_caches = [dict(cache) for cache in caches]
+    saved_functions = (tex_file_writing.tex_to_svg_file, tex_mobject.tex_to_svg_file)
+    for cache in caches:
+        cache.clear()
+    tex_file_writing.tex_to_svg_file = record
+    tex_mobject.tex_to_svg_file = record
+    try:
+        yield jobs
+    finally:
+        tex_file_writing.tex_to_svg_file, tex_mobject.tex_to_svg_file = saved_functions
+        for cache, saved in zip(caches, saved_caches):
+            cache.clear()
+            cache.update(saved)
+        placeholder.unlink(missing_ok=True)
+
+
+# run construct() with every animation turned into a no-op to see which Tex it builds
+def collect_tex(scene_class):
+    with recording_tex() as jobs:
+        scene = scene_class()
+        scene.play = lambda *args, **kwargs: None
+        scene.next_section = lambda *args, **kwargs: None
+        scene.construct()
+    return jobs
+
+
+def batch_document(tex_template, outputs):
+    # standalone's multi mode turns every standalone environment into its own page
+    documentclass = tex_template.documentclass.replace(
+        "[preview]{standalone}", "[preview,multi]{standalone}"
+    )
+    pages = []
+    for output in outputs:
+        start = output.index(BEGIN_DOCUMENT) + len(BEGIN_DOCUMENT)
+        end = output.rindex(END_DOCUMENT)
+        pages.append(f"\\begin{{standalone}}{output[start:end]}\\end{{standalone}}")
+    return "\n".join(
+        [documentclass, tex_template.preamble, BEGIN_DOCUMENT, *pages, END_DOCUMENT, ""]
+    )
+
+
+# compile many Tex strings as one multi-page document and split the pages into the cache
+def compile_batch(tex_template, jobs):
+    tex_dir = config.get_dir("tex_dir")
+    keys = sorted(jobs)
+    outputs = [jobs[key] for key in keys]
+    batch_file = tex_dir / f"batch_{tex_hash(''.join(keys))}.tex"
+    batch_file.write_text(batch_document(tex_template, outputs), encoding="utf-8")
+
+    try:
+        dvi_file = tex_file_writing.compile_tex(
+            batch_file, tex_template.tex_compiler, tex_template.output_format
+        )
+    except ValueError:
+        logger.warning("Batch Tex compile failed, compiling strings one at a time")
+        return 0
+
+    command = [
+        "dvisvgm",
+        "--page=1-",
+        "--no-fonts",
+        "--verbosity=0",
+        f"--output={batch_file.stem}-%p",
+        dvi_file.name,
+    ]
+    if tex_template.output_format == ".pdf":
+        command.insert(1, "--pdf")
+    subprocess.run(command, cwd=tex_dir, stdout=subprocess.DEVNULL, check=False)
+
+    pages = sorted(
+        tex_dir.glob(f"{batch_file.stem}-*.svg"),
+        key=lambda path: int(re.search(r"-(\d+)$", path.stem).group(1)),
+    )
+    if len(pages) != len(keys):
+        logger.warning(
+            f"Batch Tex compile produced {len(pages)} pages for {len(keys)} strings"
+        )
+        for page in pages:
+            page.unlink()
+        return 0
+
+    cache = tex_cache.get_cache()
+    for key, output, page in zip(keys, outputs, pages):
+        svg_file = tex_dir / f"{key}.svg"
+        os.replace(page, svg_file)
+        svg_file.with_suffix(".tex").write_text(output, encoding="utf-8")
+        cache.add(key, svg_file)
+    cache.remove_intermediates(batch_file)
+    batch_file.unlink()
+    return len(keys)
+
+
+def precompile_tex(scene_class):
+    tex_dir = config.get_dir("tex_dir")
+    source = Path(inspect.getsourcefile(scene_class)).read_text()
+    manifest = tex_dir / f"batch_{scene_class.__name__}.json"
+    source_hash = tex_hash(source)
+
+    # skip the dry run when the scene file hasn't changed since everything compiled
+    if manifest.exists():
+        recorded = json.loads(manifest.read_text())
+        if recorded["source"] == source_hash and all(
+            (tex_dir / f"{key}.svg").exists() for key in recorded["keys"]
+        ):
+            return
+
+    by_template = {}
+    collected = collect_tex(scene_class)
+    for key, (output, tex_template) in collected.items():
+        if (tex_dir / f"{key}.svg").exists():
+            continue
+        jobs = by_template.setdefault(id(tex_template), (tex_template, {}))[1]
+        jobs[key] = output
+
+    for tex_template, jobs in by_template.values():
+        if "{standalone}" not in tex_template.documentclass:
+            continue
+        compiled = compile_batch(tex_template, jobs)
+        logger.info(f"Batch compiled {compiled} Tex strings for {scene_class.__name__}")
+
+    manifest.write_text(json.dumps({"source": source_hash, "keys": sorted(collected)}))
+
+
+# compile all of a scene's Tex in one latex + one dvisvgm run before construct()
+class BatchTex:
+    def setup(self):
+        super().setup()
+        precompile_tex(type(self))
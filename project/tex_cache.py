@@ -0,0 +1,228 @@
+import argparse
+import atexit
+import json
+import os
+import time
+from pathlib import Path
+
+from manim import config, logger
+from manim.mobject.text import tex_mobject
+from manim.utils import tex_file_writing
+from manim.utils.tex_file_writing import tex_hash
+
+INDEX_NAME = "index.json"
+DEFAULT_MAX_SIZE = "64M"
+# everything latex/dvisvgm leave behind that isn't needed once the .svg exists
+INTERMEDIATE_SUFFIXES = (".aux", ".dvi", ".xdv", ".pdf", ".log")
+# the files of compiles that may be running in another process: Tex worker
+# drivers and jobs (tex_pool) and batch documents (tex_batch)
+WORK_PREFIXES = ("pool_", "batch_")
+
+_original_tex_to_svg_file = tex_file_writing.tex_to_svg_file
+_cache = None
+
+
+def parse_size(size):
+    if isinstance(size, (int, float)):
+        return int(size)
+    size = size.strip().upper().rstrip("B")
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3}
+    if size and size[-1] in units:
+        return int(float(size[:-1]) * units[size[-1]])
+    return int(size)
+
+
+def is_work_file(path):
+    return Path(path).name.startswith(WORK_PREFIXES)
+
+
+# hash -> svg entry index for a Tex directory, with LRU eviction to a size budget
+class TexCache:
+    def __init__(self, tex_dir, max_size=DEFAULT_MAX_SIZE):
+        self.tex_dir = Path(tex_dir)
+        self.index_path = self.tex_dir / INDEX_NAME
+        self.max_size = parse_size(max_size)
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        if self.index_path.exists():
+            try:
+                self.entries = json.loads(self.index_path.read_text())
+            except ValueError:
+                logger.warning(f"Ignoring corrupt Tex cache index {self.index_path}")
+                self.entries = {}
+
+    def save(self):
+        if not self.dirty:
+            return
+        # other render processes may have indexed entries since we loaded
+        if self.index_path.exists():
+            try:
+                on_disk = json.loads(self.index_path.read_text())
+            except ValueError:
+                on_disk = {}
+            for key, entry in on_disk.items():
+                ours = self.entries.get(key)
+                if ours is None:
+                    if (self.tex_dir / entry["svg"]).exists():
+                        self.entries[key] = entry
+                else:
+                    ours["last_used"] = max(ours["last_used"], entry["last_used"])
+        self.evict()
+        self.tex_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.entries, indent=1, sort_keys=True))
+        os.replace(tmp_path, self.index_path)
+        self.dirty = False
+
+    def total_size(self):
+        return sum(entry["size"] for entry in self.entries.values())
+
+    def lookup(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if not (self.tex_dir / entry["svg"]).exists():
+            # deleted behind the index's back; compile it again
+            self.remove(key)
+            return None
+        entry["last_used"] = time.time()
+        self.dirty = True
+        return self.tex_dir / entry["svg"]
+
+    def add(self, key, svg_file):
+        svg_file = Path(svg_file)
+        self.remove_intermediates(svg_file)
+        size = svg_file.stat().st_size
+        tex_file = svg_file.with_suffix(".tex")
+        if tex_file.exists():
+            size += tex_file.stat().st_size
+        self.entries[key] = {
+            "svg": svg_file.name,
+            "size": size,
+            "last_used": time.time(),
+        }
+        self.dirty = True
+        return svg_file
+
+    def remove_intermediates(self, svg_file):
+        for suffix in INTERMEDIATE_SUFFIXES:
+            Path(svg_file).with_suffix(suffix).unlink(missing_ok=True)
+
+    def remove(self, key):
+        entry = self.entries.pop(key)
+        svg_file = self.tex_dir / entry["svg"]
+        svg_file.unlink(missing_ok=True)
+        svg_file.with_suffix(".tex").unlink(missing_ok=True)
+        self.remove_intermediates(svg_file)
+        self.dirty = True
+
+    # drop least recently used entries until we're back under budget
+    def evict(self):
+        total = self.total_size()
+        if total <= self.max_size:
+            return 0
+        evicted = 0
+        for key in sorted(self.entries, key=lambda k: self.entries[k]["last_used"]):
+            if total <= self.max_size:
+                break
+            total -= self.entries[key]["size"]
+            self.remove(key)
+            evicted += 1
+        return evicted
+
+    # reconcile the index with the directory, then evict to budget
+    def prune(self):
+        removed = 0
+        for key, entry in list(self.entries.items()):
+            if not (self.tex_dir / entry["svg"]).exists():
+                del self.entries[key]
+                removed += 1
+
+        indexed = {entry["svg"] for entry in self.entries.values()}
+        for svg_file in self.tex_dir.glob("*.svg"):
+            if svg_file.name not in indexed and not is_work_file(svg_file):
+                self.add(svg_file.stem, svg_file)
+
+        # leftovers from failed or interrupted compiles
+        for path in list(self.tex_dir.iterdir()):
+            if is_work_file(path):
+                continue
+            orphan_tex = path.suffix == ".tex" and not path.with_suffix(".svg").exists()
+            if path.suffix in INTERMEDIATE_SUFFIXES or orphan_tex:
+                path.unlink()
+                removed += 1
+
+        self.dirty = True
+        evicted = self.evict()
+        self.save()
+        return removed, evicted
+
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        max_size = os.environ.get("CALC_TEX_CACHE_SIZE", DEFAULT_MAX_SIZE)
+        _cache = TexCache(config.get_dir("tex_dir"), max_size)
+        atexit.register(_cache.save)
+    return _cache
+
+
+def cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    if environment is not None:
+        output = tex_template.get_texcode_for_expression_in_env(expression, environment)
+    else:
+        output = tex_template.get_texcode_for_expression(expression)
+
+    cache = get_cache()
+    key = tex_hash(output)
+    svg_file = cache.lookup(key)
+    if svg_file is not None:
+        return svg_file
+
+    # unindexed entries left by older runs still count as hits
+    svg_file = cache.tex_dir / f"{key}.svg"
+    if not svg_file.exists():
+        svg_file = _original_tex_to_svg_file(expression, environment, tex_template)
+    return cache.add(key, svg_file)
+
+
+# route every Tex/MathTex through the indexed cache
+def install():
+    tex_file_writing.tex_to_svg_file = cached_tex_to_svg_file
+    tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the Tex cache.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    prune = subparsers.add_parser(
+        "prune", help="reconcile the index and evict to budget"
+    )
+    prune.add_argument(
+        "--tex-dir",
+        default=Path(__file__).parent / "media" / "Tex",
+        type=Path,
+    )
+    prune.add_argument(
+        "--max-size",
+        default=os.environ.get("CALC_TEX_CACHE_SIZE", DEFAULT_MAX_SIZE),
+        help="size budget, e.g. 64M or 1G",
+    )
+    args = parser.parse_args()
+
+    if args.command == "prune":
+        cache = TexCache(args.tex_dir, args.max_size)
+        removed, evicted = cache.prune()
+        print(
+            f"{len(cache.entries)} entries, {cache.total_size() / 1024**2:.1f} MiB "
+            f"({removed} stale files removed, {evicted} entries evicted)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Warm latex processes for the Tex-to-SVG step.
+
+One spare per preamble and process, not one per core: a render compiles its
+Tex one file at a time, so only the next compile ever waits on a worker. The
+spare has already loaded the preamble, which is most of latex's run time; each
+job still starts the replacement spare, a new latex process, in the background.
+Parallel renders (render.py -j/--batch) get a spare in every process.
+"""
+
+import atexit
+import itertools
+import os
+import subprocess
+from pathlib import Path
+
+from manim import config, logger
+from manim.utils import tex_file_writing
+from manim.utils.tex_file_writing import print_all_tex_errors, tex_hash
+
+from tex_batch import BEGIN_DOCUMENT, END_DOCUMENT
+
+_original_compile_tex = tex_file_writing.compile_tex
+_pools = {}
+# the workers read the document body through it; where it doesn't exist
+# (Windows) every Tex compiles as usual
+STDIN = Path("/dev/stdin")
+
+
+def split_document(text):
+    start = text.index(BEGIN_DOCUMENT)
+    end = text.rindex(END_DOCUMENT)
+    return text[:start], text[start + len(BEGIN_DOCUMENT) : end]
+
+
+def worker_command(tex_compiler, output_format, driver_file, tex_dir, jobname):
+    if tex_compiler == "xelatex":
+        flags = ["-no-pdf"] if output_format == ".xdv" else []
+    else:
+        flags = [f"-output-format={output_format[1:]}"]
+    return [
+        tex_compiler,
+        *flags,
+        "-interaction=batchmode",
+        "-halt-on-error",
+        f"-output-directory={tex_dir.as_posix()}",
+        f"-jobname={jobname}",
+        driver_file.name,
+    ]
+
+
+# a latex process that has already loaded the preamble and is blocked
+# reading the document body from its stdin
+class TexWorker:
+    def __init__(self, command, tex_dir, jobname):
+        self.tex_dir = tex_dir
+        self.jobname = jobname
+        self.process = subprocess.Popen(
+            command,
+            cwd=tex_dir,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def output_file(self, suffix):
+        return self.tex_dir / f"{self.jobname}{suffix}"
+
+    def run(self, body):
+        self.process.communicate(body.encode("utf-8"))
+        return self.process.returncode
+
+    def kill(self):
+        self.process.kill()
+        self.process.wait()
+        self.clean_up()
+
+    def clean_up(self):
+        for suffix in (".aux", ".log", ".dvi", ".xdv", ".pdf"):
+            self.output_file(suffix).unlink(missing_ok=True)
+
+
+# keeps one warm worker for one preamble, replaced as soon as it takes a job so
+# the next one starts loading the preamble while this one compiles
+class TexWorkerPool:
+    def __init__(self, tex_compiler, output_format, preamble):
+        self.tex_compiler = tex_compiler
+        self.output_format = output_format
+        self.tex_dir = config.get_dir("tex_dir")
+        self.pid = os.getpid()
+        self.jobs = itertools.count()
+
+        self.tex_dir.mkdir(parents=True, exist_ok=True)
+        # per process, so a forked render's close() leaves the others' driver be
+        self.driver_file = self.tex_dir / f"pool_{self.pid}_{tex_hash(preamble)}.tex"
+        self.driver_file.write_text(
+            # TeX's primitive \input; LaTeX's \input probes the file with \openin first
+            f"{preamble}{BEGIN_DOCUMENT}\n"
+            f"\\csname @@input\\endcsname {STDIN.as_posix()} \n"
+            f"{END_DOCUMENT}\n",
+            encoding="utf-8",
+        )
+        self.spare = self.spawn()
+
+    def spawn(self):
+        jobname = f"pool_{self.pid}_{next(self.jobs)}"
+        command = worker_command(
+            self.tex_compiler,
+            self.output_format,
+            self.driver_file,
+            self.tex_dir,
+            jobname,
+        )
+        return TexWorker(command, self.tex_dir, jobname)
+
+    def compile(self, tex_file, body):
+        worker, self.spare = self.spare, self.spawn()
+
+        result = tex_file.with_suffix(self.output_format)
+        if worker.run(body) != 0:
+            log_file = tex_file.with_suffix(".log")
+            if worker.output_file(".log").exists():
+                os.replace(worker.output_file(".log"), log_file)
+            worker.clean_up()
+            print_all_tex_errors(log_file, self.tex_compiler, tex_file)
+            raise ValueError(
+                f"{self.tex_compiler} error converting to"
+                f" {self.output_format[1:]}. See log output above or"
+                f" the log file: {log_file}",
+            )
+        os.replace(worker.output_file(self.output_format), result)
+        worker.clean_up()
+        return result
+
+    def close(self):
+        if os.getpid() != self.pid:
+            return
+        if self.spare is not None:
+            self.spare.kill()
+            self.spare = None
+        self.driver_file.unlink(missing_ok=True)
+
+
+def get_pool(tex_compiler, output_format, preamble):
+    key = (tex_compiler, output_format, preamble)
+    pool = _pools.get(key)
+    # forked render workers must not share the parent's pipes
+    if pool is None or pool.pid != os.getpid():
+        pool = TexWorkerPool(tex_compiler, output_format, preamble)
+        _pools[key] = pool
+        atexit.register(pool.close)
+    return pool
+
+
+# forked processes exit without running atexit, so they close their pools by hand
+def close_pools():
+    for pool in _pools.values():
+        pool.close()
+    # a later compile in this process starts a fresh pool
+    _pools.clear()
+
+
+def pooled_compile_tex(tex_file, tex_compiler, output_format):
+    result = tex_file.with_suffix(output_format)
+    if result.exists():
+        return result
+
+    preamble, body = split_document(tex_file.read_text(encoding="utf-8"))
+    template_preamble, _ = split_document(config["tex_template"].body)
+    # only the configured template is kept warm, anything else compiles as usual
+    if preamble != template_preamble or not STDIN.exists():
+        return _original_compile_tex(tex_file, tex_compiler, output_format)
+
+    logger.debug(f"Compiling {tex_file.name} on a warm {tex_compiler} worker")
+    return get_pool(tex_compiler, output_format, preamble).compile(tex_file, body)
+
+
+# route the Tex-to-SVG step's latex runs through the worker pool
+def install():
+    tex_file_writing.compile_tex = pooled_compile_tex
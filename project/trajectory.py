@@ -0,0 +1,86 @@
+import numpy as np
+from manim import *
+
+# how far a frame's alpha may be from the table's before we evaluate directly
+ALPHA_TOLERANCE = 1e-9
+
+
+# a quantity computed from a tracker's value; `function` maps an array of
+# values to an array of results (one per value), so a whole sweep is one call
+class Derived:
+    def __init__(self, tracker, function):
+        self.tracker = tracker
+        self.function = function
+        self.table = None
+
+    def tabulate(self, values):
+        self.table = np.asarray(self.function(values))
+
+    def get_value(self):
+        frame = self.tracker.frame
+        if frame is not None and self.table is not None:
+            return self.table[frame]
+        return self.function(np.array([self.tracker.get_value()]))[0]
+
+
+# a ValueTracker whose sweeps are evaluated for every frame up front; updaters
+# read derived quantities from the tables instead of recomputing them
+class TrajectoryTracker(ValueTracker):
+    def __init__(self, value=0, **kwargs):
+        self.derived = []
+        self.frame = None
+        super().__init__(value, **kwargs)
+
+    def set_value(self, value):
+        self.frame = None
+        return super().set_value(value)
+
+    def derive(self, function):
+        derived = Derived(self, function)
+        self.derived.append(derived)
+        return derived
+
+    def sweep(self, target, **kwargs):
+        return Sweep(self, target, **kwargs)
+
+
+# tracker.animate.set_value(target), with the value and every derived quantity
+# tabulated for each frame of the play in begin()
+class Sweep(Animation):
+    def __init__(self, tracker, target, **kwargs):
+        self.target = target
+        super().__init__(tracker, **kwargs)
+
+    def frame_alphas(self):
+        # the alphas Scene.update_to_time will pass, then finish()'s 1
+        times = np.arange(0, self.run_time, 1 / config["frame_rate"])
+        return np.append(times / self.run_time, 1.0)
+
+    def begin(self):
+        tracker = self.mobject
+        self.alphas = self.frame_alphas()
+        start = tracker.get_value()
+        rates = np.array([self.rate_func(alpha) for alpha in self.alphas])
+        self.values = start + (self.target - start) * rates
+        for derived in tracker.derived:
+            derived.tabulate(self.values)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        tracker = self.mobject
+        index = min(np.searchsorted(self.alphas, alpha), len(self.alphas) - 1)
+        if abs(self.alphas[index] - alpha) <= ALPHA_TOLERANCE:
+            tracker.set_value(self.values[index])
+            tracker.frame = index
+        else:
+            # a time we didn't tabulate, e.g. a play with a different frame rate
+            start = self.values[0]
+            tracker.set_value(start + (self.target - start) * self.rate_func(alpha))
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        tracker = self.mobject
+        tracker.frame = None
+        # stale tables would otherwise change the hash of later plays
+        for derived in tracker.derived:
+            derived.table = None
@@ -0,0 +1,35 @@
+import subprocess
+from pathlib import Path
+
+from manim import config, logger
+
+
+# join videos with identical encodings back to back without re-encoding
+def concat_videos(inputs, output):
+    output = Path(output)
+    file_list = output.with_name(f"{output.stem}_concat.txt")
+    with file_list.open("w", encoding="utf-8") as fp:
+        for path in inputs:
+            fp.write(f"file 'file:{Path(path).resolve().as_posix()}'\n")
+    command = [
+        config.ffmpeg_executable,
+        "-y",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        str(file_list),
+        "-loglevel",
+        config.ffmpeg_loglevel.lower(),
+        "-nostdin",
+        "-c",
+        "copy",
+        str(output),
+    ]
+    logger.debug(f"Concatenating {len(inputs)} videos into {output}")
+    try:
+        subprocess.run(command, check=True)
+    finally:
+        file_list.unlink(missing_ok=True)
+    return output
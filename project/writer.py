@@ -0,0 +1,493 @@
+import json
+import os
+import re
+import subprocess
+from pathlib import Path
+
+from manim import __version__, config, logger
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import (
+    guarantee_existence,
+    is_gif_format,
+    is_png_format,
+    is_webm_format,
+    write_to_movie,
+)
+
+import numpy as np
+
+from frame_pipe import FramePipe
+from partial_store import get_store, store_key
+from streams import (
+    SectionStream,
+    boundary_times,
+    format_times,
+    load_frame_plan,
+    segment,
+    trim,
+)
+
+# comma separated extra qualities, e.g. "480p15,720p30", encoded from the same frames
+EXTRA_OUTPUTS_ENV = "CALC_EXTRA_OUTPUTS"
+# set to 1 to only write the partial movie files, for render.py's section
+# workers; the parent combines them into the movie, sections and clips
+PARTIALS_ONLY_ENV = "CALC_PARTIALS_ONLY"
+
+
+def parse_quality(spec):
+    match = re.fullmatch(r"(\d+)p(\d+(?:\.\d+)?)", spec.strip())
+    if match is None:
+        raise ValueError(f"Quality {spec!r} is not of the form <height>p<fps>")
+    fps = float(match.group(2))
+    return int(match.group(1)), int(fps) if fps == int(fps) else fps
+
+
+def extra_qualities():
+    value = os.environ.get(EXTRA_OUTPUTS_ENV, "")
+    return [parse_quality(spec) for spec in value.split(",") if spec.strip()]
+
+
+# a lower resolution / frame rate copy of the movie, with its own quality directory
+class ExtraOutput:
+    def __init__(self, height, fps, module_name, scene_name):
+        # keep the aspect ratio, with the even sizes yuv420p needs
+        width = round(config["pixel_width"] * height / config["pixel_height"] / 2) * 2
+        self.width, self.height, self.fps = width, height - height % 2, fps
+
+        settings = config.copy()
+        settings.pixel_width, settings.pixel_height = self.width, self.height
+        settings.frame_rate = fps
+        dirs = {"module_name": module_name, "scene_name": scene_name}
+        self.quality = f"{self.height}p{fps:g}"
+        self.video_dir = guarantee_existence(settings.get_dir("video_dir", **dirs))
+        self.partial_movie_directory = guarantee_existence(
+            settings.get_dir("partial_movie_dir", **dirs)
+        )
+        self.sections_output_dir = None
+        if config.save_sections:
+            self.sections_output_dir = guarantee_existence(
+                settings.get_dir("sections_dir", **dirs)
+            )
+
+    def filters(self):
+        return [f"scale={self.width}:{self.height}", f"fps={self.fps}"]
+
+    def partial_movie_file(self, partial_movie_file):
+        return self.partial_movie_directory / Path(partial_movie_file).name
+
+    def store_key(self, hash_animation):
+        return store_key(hash_animation, self.width, self.height, self.fps)
+
+
+def codec_options():
+    if is_webm_format():
+        return ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"], []
+    if config["transparent"]:
+        return ["-vcodec", "qtrle"], []
+    return ["-vcodec", "libx264", "-pix_fmt", "yuv420p"], ["format=yuv420p"]
+
+
+# keyframes at `keyframes` (seconds), IDR ones with x264 so every cut is clean
+def keyframe_options(keyframes, codec):
+    if not keyframes:
+        return []
+    options = ["-force_key_frames", format_times(keyframes)]
+    if "libx264" in codec:
+        options += ["-forced-idr", "1"]
+    return options
+
+
+def output_options():
+    return [
+        "-an",
+        "-metadata",
+        f"comment=Rendered with Manim Community v{__version__}",
+    ]
+
+
+# the command SceneFileWriter.open_movie_pipe runs, plus optional filters,
+# forced keyframes and extra outputs split off the same decoded frames
+def encoder_command(file_path, filters=(), extra_outputs=(), keyframes=()):
+    fps = config["frame_rate"]
+    if fps == int(fps):
+        fps = int(fps)
+    command = [
+        config.ffmpeg_executable,
+        "-y",
+        "-f",
+        "rawvideo",
+        "-s",
+        f"{config['pixel_width']}x{config['pixel_height']}",
+        "-pix_fmt",
+        "rgba",
+        "-r",
+        str(fps),
+        "-i",
+        "-",
+        "-loglevel",
+        config["ffmpeg_loglevel"].lower(),
+    ]
+    codec, conversion = codec_options()
+    codec = [*codec, *keyframe_options(keyframes, codec)]
+    filters = [*conversion, *filters]
+    if not extra_outputs:
+        if filters:
+            command += ["-vf", ",".join(filters)]
+        return [*command, *output_options(), *codec, str(file_path)]
+
+    labels = [f"[out{index}]" for index in range(len(extra_outputs) + 1)]
+    graph = [f"[0:v]{','.join(filters) or 'null'},split={len(labels)}{''.join(labels)}"]
+    for label, output in zip(labels[1:], extra_outputs):
+        graph.append(f"{label}{','.join(output.filters())}{label[:-1]}s]")
+    command += ["-filter_complex", ";".join(graph)]
+    command += ["-map", labels[0], *output_options(), *codec, str(file_path)]
+    for label, output in zip(labels[1:], extra_outputs):
+        command += [
+            "-map",
+            f"{label[:-1]}s]",
+            *output_options(),
+            *codec,
+            str(output.partial_movie_file(file_path)),
+        ]
+    return command
+
+
+# for a cached partial that only exists at the main quality
+def transcode(source, target, output):
+    codec, conversion = codec_options()
+    command = [
+        config.ffmpeg_executable,
+        "-y",
+        "-i",
+        str(source),
+        "-loglevel",
+        config["ffmpeg_loglevel"].lower(),
+        "-vf",
+        ",".join([*conversion, *output.filters()]),
+        *output_options(),
+        *codec,
+        str(target),
+    ]
+    subprocess.run(command, check=True)
+
+
+# starts ffmpeg on the first frame instead of at the start of every play, so a
+# play that is one held frame can hand ffmpeg that frame once and have it repeat;
+# the same ffmpeg also writes every extra quality from CALC_EXTRA_OUTPUTS. Frames
+# reach it through a FramePipe, so rendering the next frame overlaps the write.
+# With CALC_STREAM_SECTIONS and a frame plan, one ffmpeg takes every play of a
+# section and the partials are cut out of its output at the planned keyframes.
+# Narration marks split the movie into clips, joined from the partials between them
+class ProjectFileWriter(SceneFileWriter):
+    def __init__(self, *args, **kwargs):
+        self.frame_pipe = FramePipe()
+        # frames each play wrote (or would have, if cached), by play index
+        self.play_lengths = {}
+        # (index of the play after the mark, narration text)
+        self.narration_marks = []
+        super().__init__(*args, **kwargs)
+
+    def init_output_directories(self, scene_name):
+        super().init_output_directories(scene_name)
+        self.extra_outputs = []
+        self.frame_plan = None
+        self.stream = None
+        if config["dry_run"] or not write_to_movie() or is_gif_format():
+            return
+        self.frame_plan = load_frame_plan(scene_name)
+        module_name = config.get_dir("input_file").stem if config["input_file"] else ""
+        main = (config["pixel_height"], config["frame_rate"])
+        for height, fps in extra_qualities():
+            if (height, fps) != main:
+                self.extra_outputs.append(
+                    ExtraOutput(height, fps, module_name, scene_name)
+                )
+
+    def open_movie_pipe(self, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        if self.stream is not None and self.stream.next_play != self.renderer.num_plays:
+            # a cached or skipped play in between, the planned keyframes are off
+            self.finish_stream()
+        self.partial_movie_file_path = file_path
+        self.writing_process = None if self.stream is None else self.stream.process
+        self.play_frames = 0
+
+    def start_encoder(self, filters=()):
+        command = encoder_command(
+            self.partial_movie_file_path, filters, self.extra_outputs
+        )
+        self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self.frame_pipe.open(self.writing_process.stdin)
+
+    def start_stream(self):
+        name = f"stream_{Path(self.partial_movie_file_path).name}"
+        self.stream = SectionStream(
+            self.partial_movie_directory / name,
+            self.renderer.num_plays,
+            self.frame_plan,
+        )
+        command = encoder_command(
+            self.stream.path,
+            extra_outputs=self.extra_outputs,
+            keyframes=self.stream.keyframes,
+        )
+        self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self.stream.process = self.writing_process
+        self.frame_pipe.open(self.writing_process.stdin)
+
+    def write_frame(self, frame_or_renderer):
+        if not write_to_movie():
+            return super().write_frame(frame_or_renderer)
+        if self.writing_process is None:
+            if self.frame_plan and self.renderer.num_plays < len(self.frame_plan):
+                self.start_stream()
+            else:
+                self.start_encoder()
+        self.frame_pipe.put(frame_or_renderer)
+        self.play_frames += 1
+
+    # `num_frames` copies of `frame`, converted once and repeated inside ffmpeg;
+    # the partial stays constant frame rate so it still concatenates with copy
+    def write_still(self, frame, num_frames):
+        if num_frames <= 0:
+            return
+        if (
+            not write_to_movie()
+            or is_png_format()
+            or self.writing_process is not None
+            or self.frame_plan
+        ):
+            for _ in range(num_frames):
+                self.write_frame(frame)
+            return
+        self.start_encoder([f"loop=loop={num_frames - 1}:size=1:start=0"])
+        self.frame_pipe.put(frame)
+        logger.debug(f"Held one frame for {num_frames} frames")
+
+    def close_movie_pipe(self):
+        if self.stream is not None and self.writing_process is self.stream.process:
+            self.stream.add_play(self.partial_movie_file_path, self.play_frames)
+            if self.play_frames != self.stream.planned(self.renderer.num_plays):
+                # the play didn't end on a planned keyframe, so the stream ends with it
+                self.finish_stream()
+            return
+        if self.writing_process is None:
+            # a play without frames still leaves a (empty) partial behind
+            self.start_encoder()
+        self.frame_pipe.close()
+        super().close_movie_pipe()
+        self.store_partial(self.partial_movie_file_path)
+
+    # close the section's ffmpeg and cut a partial per play out of each output,
+    # copying the packets
+    def finish_stream(self):
+        stream, self.stream = self.stream, None
+        if stream is None:
+            return
+        self.frame_pipe.close()
+        stream.process.stdin.close()
+        stream.process.wait()
+
+        written = [path for path, frames in stream.plays if frames]
+        ends = np.cumsum([frames for _, frames in stream.plays if frames]).tolist()
+        times = boundary_times(ends[:-1])
+        codec, conversion = codec_options()
+        sources = [(stream.path, written)]
+        for output in self.extra_outputs:
+            sources.append(
+                (
+                    output.partial_movie_file(stream.path),
+                    [output.partial_movie_file(path) for path in written],
+                )
+            )
+        for source, targets in sources:
+            if targets and not segment(source, times, targets):
+                logger.warning(
+                    f"{source.name} did not split at its planned keyframes, "
+                    "re-encoding its pieces"
+                )
+                trim(source, times, targets, codec, conversion)
+            source.unlink(missing_ok=True)
+
+        for path, frames in stream.plays:
+            if not frames:
+                subprocess.run(
+                    encoder_command(path, extra_outputs=self.extra_outputs), input=b""
+                )
+            self.store_partial(path)
+        logger.info(
+            f"Animations {stream.first_play} to {stream.next_play - 1} : "
+            f"{len(stream.plays)} partial movie files cut from one stream"
+        )
+
+    def store_partial(self, partial_movie_file):
+        if config["disable_caching"]:
+            return
+        store = get_store()
+        for key, path in self.store_entries(Path(partial_movie_file).stem):
+            if path.exists():
+                store.add(key, path)
+
+    def next_section(self, *args, **kwargs):
+        self.finish_stream()
+        super().next_section(*args, **kwargs)
+
+    def finish(self):
+        self.finish_stream()
+        if os.environ.get(PARTIALS_ONLY_ENV, "0") != "0":
+            return
+        super().finish()
+        if write_to_movie() and not config["dry_run"] and self.narration_marks:
+            self.write_narration_clips()
+
+    def mark_narration(self, play, text):
+        self.narration_marks.append((play, " ".join(text.split())))
+
+    # (name, narration, first play, end play, partial movie files) of every clip:
+    # the plays before the first mark ("lead"), then the plays from each mark to
+    # the next, named by the mark's index so a clip's name never depends on which
+    # plays this render wrote. Clips with a play that wasn't written are left out
+    def narration_clips(self):
+        bounds = [0, *(play for play, _ in self.narration_marks)]
+        texts = [None, *(text for _, text in self.narration_marks)]
+        ends = [*bounds[1:], len(self.partial_movie_files)]
+        names = ["lead", *(f"{number:02}" for number in range(len(texts) - 1))]
+        clips = []
+        for name, text, start, end in zip(names, texts, bounds, ends):
+            files = self.partial_movie_files[start:end]
+            if files and all(files):
+                clips.append((name, text, start, end, files))
+        return clips
+
+    # every partial starts on a keyframe (its own encode, or a planned boundary
+    # of a section stream), so the clips are packet copies of the partials
+    def write_narration_clips(self):
+        fps = config["frame_rate"]
+        written = [
+            self.play_lengths.get(index, 0) if path else 0
+            for index, path in enumerate(self.partial_movie_files)
+        ]
+        clips_dir = self.movie_file_path.with_name(f"{self.output_name}_clips")
+        clips_dir.mkdir(exist_ok=True)
+        cuts = []
+        for name, text, start, end, files in self.narration_clips():
+            clip = clips_dir / f"{self.output_name}_{name}{self.movie_file_path.suffix}"
+            self.combine_files(files, clip)
+            for output in self.extra_outputs:
+                extra_dir = output.video_dir / clips_dir.name
+                extra_dir.mkdir(exist_ok=True)
+                self.combine_files(
+                    self.extra_partial_movie_files(output, files),
+                    extra_dir / clip.name,
+                )
+            start_frame = sum(written[:start])
+            frames = sum(written[start:end])
+            cuts.append(
+                {
+                    "clip": clip.name,
+                    "start": start_frame / fps,
+                    "end": (start_frame + frames) / fps,
+                    "start_frame": start_frame,
+                    "frames": frames,
+                    "narration": text,
+                }
+            )
+        cut_list = self.movie_file_path.with_name(f"{self.output_name}_cuts.json")
+        cut_list.write_text(json.dumps(cuts, indent=4), encoding="utf-8")
+        logger.info(f"{len(cuts)} narration clips written to {clips_dir}")
+
+    # (store key, partial movie file) for the main quality and each extra one
+    def store_entries(self, hash_animation):
+        path = self.partial_movie_directory / (
+            f"{hash_animation}{config['movie_file_extension']}"
+        )
+        entries = [
+            (
+                store_key(
+                    hash_animation,
+                    config["pixel_width"],
+                    config["pixel_height"],
+                    config["frame_rate"],
+                ),
+                path,
+            )
+        ]
+        for output in self.extra_outputs:
+            entries.append(
+                (output.store_key(hash_animation), output.partial_movie_file(path))
+            )
+        return entries
+
+    # a partial rendered by any scene file or quality run counts as cached
+    def is_already_cached(self, hash_invocation):
+        if not hasattr(self, "partial_movie_directory") or not write_to_movie():
+            return False
+        store = get_store()
+        (key, path), *extras = self.store_entries(hash_invocation)
+        if path.exists():
+            # partials from before the store existed are moved into it as they're hit
+            store.add(key, path)
+        elif not store.fetch(key, path):
+            return False
+        for key, path in extras:
+            if not path.exists():
+                store.fetch(key, path)
+        return True
+
+    def extra_partial_movie_files(self, output, partial_movie_files):
+        files = []
+        for partial_movie_file in partial_movie_files:
+            extra_file = output.partial_movie_file(partial_movie_file)
+            if not extra_file.exists():
+                logger.debug(
+                    f"Transcoding cached {partial_movie_file} to {output.quality}"
+                )
+                transcode(partial_movie_file, extra_file, output)
+                if not config["disable_caching"]:
+                    key = output.store_key(Path(partial_movie_file).stem)
+                    get_store().add(key, extra_file)
+            files.append(str(extra_file))
+        return files
+
+    def combine_to_movie(self):
+        super().combine_to_movie()
+        partial_movie_files = [
+            path for path in self.partial_movie_files if path is not None
+        ]
+        for output in self.extra_outputs:
+            movie_file_path = output.video_dir / self.movie_file_path.name
+            logger.info(f"Combining to {output.quality} movie file.")
+            self.combine_files(
+                self.extra_partial_movie_files(output, partial_movie_files),
+                movie_file_path,
+            )
+
+    def combine_to_section_videos(self):
+        super().combine_to_section_videos()
+        for output in self.extra_outputs:
+            sections_index = []
+            for section in self.sections:
+                if section.video is None:
+                    continue
+                self.combine_files(
+                    self.extra_partial_movie_files(
+                        output, section.get_clean_partial_movie_files()
+                    ),
+                    output.sections_output_dir / section.video,
+                )
+                sections_index.append(section.get_dict(output.sections_output_dir))
+            index_path = output.sections_output_dir / f"{self.output_name}.json"
+            index_path.write_text(
+                json.dumps(sections_index, indent=4), encoding="utf-8"
+            )
+
+    def clean_cache(self):
+        super().clean_cache()
+        main_directory = self.partial_movie_directory
+        try:
+            for output in self.extra_outputs:
+                self.partial_movie_directory = output.partial_movie_directory
+                super().clean_cache()
+        finally:
+            self.partial_movie_directory = main_directory